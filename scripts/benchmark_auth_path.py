@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark the auth path in-process on embedded SQLite.
+
+Runs the FastAPI app through httpx's ASGI transport (no network, no Postgres), so
+the numbers are gateway overhead: routing, validation, JWT, caches, bcrypt and the
+ORM on a local database. Compare with the same endpoints against Postgres to see
+how much of the latency is the database.
+
+Usage:
+    python scripts/benchmark_auth_path.py [--requests 500] [--rounds 4]
+    python scripts/benchmark_auth_path.py --database-url sqlite:///bench.db
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+async def timed(client, requests: int, method: str, url: str, **kwargs):
+    timings = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = await client.request(method, url, **kwargs)
+        timings.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+    timings.sort()
+    return {
+        "p50": statistics.median(timings),
+        "p95": timings[int(len(timings) * 0.95) - 1],
+        "mean": statistics.fmean(timings),
+    }
+
+
+async def run_benchmark(requests: int):
+    import httpx
+
+    import main
+    from src.auth.user_cache import user_profile_cache
+    from src.config.database import engine
+    from src.config.migrations import run_migrations
+
+    await run_migrations()
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        credentials = {"username": "bench", "password": "bench-password"}
+        await client.post("/auth/register", json={"email": "bench@example.com", **credentials})
+        login = await client.post("/auth/login", json=credentials)
+        login.raise_for_status()
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+        results = {
+            "GET /health": await timed(client, requests, "GET", "/health"),
+            "POST /auth/login": await timed(
+                client, max(1, requests // 10), "POST", "/auth/login", json=credentials
+            ),
+            "GET /auth/me (cached)": await timed(client, requests, "GET", "/auth/me", headers=headers),
+        }
+
+        # Uncached profile: clear the cache before every request
+        timings = []
+        for _ in range(requests):
+            user_profile_cache.clear()
+            start = time.perf_counter()
+            (await client.get("/auth/me", headers=headers)).raise_for_status()
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        results["GET /auth/me (DB)"] = {
+            "p50": statistics.median(timings),
+            "p95": timings[int(len(timings) * 0.95) - 1],
+            "mean": statistics.fmean(timings),
+        }
+
+    await engine.dispose()
+
+    print(f"\n📊 {requests:,} solicitudes por endpoint (login: {max(1, requests // 10):,}) en ms")
+    print(f"{'endpoint':<24} {'p50':>8} {'p95':>8} {'mean':>8}")
+    for name, stats in results.items():
+        print(f"{name:<24} {stats['p50']:>8.3f} {stats['p95']:>8.3f} {stats['mean']:>8.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the auth path on embedded SQLite")
+    parser.add_argument("--database-url", default="sqlite+aiosqlite://", help="Default: in-memory SQLite")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=4, help="bcrypt rounds for this run")
+    args = parser.parse_args()
+
+    # Configure before the app modules read the environment
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ["BCRYPT_ROUNDS"] = str(args.rounds)
+    asyncio.run(run_benchmark(args.requests))
+
+
+if __name__ == "__main__":
+    main()
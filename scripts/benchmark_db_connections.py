@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark PgBouncer transaction pooling against direct PostgreSQL connections.
+
+Each simulated request checks out a connection, runs the login lookup
+(``lower(username) = :x``) in its own transaction and returns the connection,
+like the auth endpoints do. The same workload runs against every configuration:
+
+    direct            DATABASE_DIRECT_URL, client-side queue pool, prepares on
+    pgbouncer+queue   DATABASE_URL via PgBouncer, queue pool, prepares off
+    pgbouncer+null    DATABASE_URL via PgBouncer, NullPool (connect per request)
+
+Usage:
+    DATABASE_DIRECT_URL=postgresql://... DATABASE_URL=postgresql://...@pgbouncer:6432/... \\
+        python scripts/benchmark_db_connections.py [--requests 5000] [--concurrency 50]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from sqlalchemy import text
+
+from src.config.database import create_database_engine, to_async_url
+
+LOOKUP_QUERY = text("SELECT id FROM users WHERE lower(username) = :login LIMIT 1")
+
+
+async def run_config(url: str, pgbouncer: bool, pool_class: str, requests: int, concurrency: int):
+    engine = create_database_engine(url, pgbouncer=pgbouncer, pool_class=pool_class)
+    semaphore = asyncio.Semaphore(concurrency)
+    timings = []
+    errors = 0
+
+    async def one_request(i: int):
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                async with engine.connect() as conn:
+                    await conn.execute(LOOKUP_QUERY, {"login": f"user{i}"})
+                    await conn.commit()
+            except Exception:
+                errors += 1
+                return
+            timings.append((time.perf_counter() - start) * 1000)
+
+    # Warm up the pool (and psycopg's prepare threshold) before measuring
+    await asyncio.gather(*(one_request(i) for i in range(concurrency)))
+    timings.clear()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one_request(i) for i in range(requests)))
+    elapsed = time.perf_counter() - start
+    await engine.dispose()
+
+    timings.sort()
+    return {
+        "rps": len(timings) / elapsed if elapsed else 0,
+        "p50": statistics.median(timings) if timings else 0,
+        "p95": timings[int(len(timings) * 0.95) - 1] if timings else 0,
+        "p99": timings[int(len(timings) * 0.99) - 1] if timings else 0,
+        "errors": errors,
+    }
+
+
+async def run_benchmark(direct_url: str, pgbouncer_url: str, requests: int, concurrency: int):
+    configs = []
+    if direct_url:
+        configs.append(("direct", direct_url, False, "queue"))
+    if pgbouncer_url:
+        configs.append(("pgbouncer+queue", pgbouncer_url, True, "queue"))
+        configs.append(("pgbouncer+null", pgbouncer_url, True, "null"))
+
+    print(f"📊 {requests:,} solicitudes, concurrencia {concurrency} (ms)")
+    print(f"{'config':<18} {'req/s':>9} {'p50':>8} {'p95':>8} {'p99':>8} {'errores':>8}")
+    for name, url, pgbouncer, pool_class in configs:
+        stats = await run_config(to_async_url(url), pgbouncer, pool_class, requests, concurrency)
+        print(
+            f"{name:<18} {stats['rps']:>9,.0f} {stats['p50']:>8.2f} {stats['p95']:>8.2f} "
+            f"{stats['p99']:>8.2f} {stats['errors']:>8}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare PgBouncer transaction pooling with direct connections")
+    parser.add_argument("--direct-url", default=os.getenv("DATABASE_DIRECT_URL"), help="PostgreSQL URL bypassing PgBouncer")
+    parser.add_argument("--pgbouncer-url", default=os.getenv("DATABASE_URL"), help="PostgreSQL URL through PgBouncer")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    if not args.direct_url and not args.pgbouncer_url:
+        parser.error("set DATABASE_DIRECT_URL and/or DATABASE_URL (or pass --direct-url/--pgbouncer-url)")
+    asyncio.run(run_benchmark(args.direct_url, args.pgbouncer_url, args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Compare FastAPI's stdlib JSONResponse with ORJSONResponse (the app default).
+
+Payloads mirror real responses: the inventory list (``List[InventarioActivoOut]``, all
+16 fields with accented values and keys such as ``DUEÑO_DE_ACTIVO``), the public owners
+list and a login token pair. Two measurements per payload:
+
+    render      response class ``render()`` only (the part the response class changes)
+    endpoint    full request through an in-process app with ``response_model`` validation,
+                via httpx's ASGI transport (no network)
+
+Both classes must produce the same JSON, with non-ASCII characters emitted as UTF-8.
+
+Usage:
+    python scripts/benchmark_json_response.py [--assets 1000] [--iterations 200]
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from src.schemas.auth import Token
+from src.schemas.inventory import InventarioActivoOut, InventarioActivoOwner
+
+OWNERS = ["Dirección de Tecnología", "Oficina Jurídica", "Gestión Humana", "Área de Comunicaciones"]
+
+
+def build_assets(count: int) -> List[dict]:
+    return [
+        {
+            "id": i,
+            "NOMBRE_DEL_ACTIVO": f"Base de datos de estudiantes {i}",
+            "DESCRIPCION": "Información académica y de matrícula de los estudiantes de pregrado y posgrado",
+            "TIPO_DE_ACTIVO": "Información",
+            "MEDIO_DE_CONSERVACIÓN": "Electrónico",
+            "FORMATO": "Base de datos",
+            "IDIOMA": "Español",
+            "PROCESO": "Gestión académica",
+            "DUEÑO_DE_ACTIVO": OWNERS[i % len(OWNERS)],
+            "TIPO_DE_DATOS_PERSONALES": "Datos personales sensibles",
+            "FINALIDAD_DE_LA_RECOLECCIÓN": "Registro y seguimiento académico",
+            "CONFIDENCIALIDAD": "Alta",
+            "INTEGRIDAD": "Alta",
+            "DISPONIBILIDAD": "Media",
+            "CRITICIDAD_TOTAL_DEL_ACTIVO": "Alta",
+            "INFORMACIÓN_PUBLICADA_O_DISPONIBLE": "No",
+            "LUGAR_DE_CONSULTA": "Sistema de información académica",
+        }
+        for i in range(count)
+    ]
+
+
+def build_payloads(asset_count: int):
+    assets = build_assets(asset_count)
+    owners = [{"id": i, "DUEÑO_DE_ACTIVO": owner} for i, owner in enumerate(OWNERS)]
+    token = {
+        "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9." + "a" * 180 + ".signature",
+        "refresh_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9." + "b" * 220 + ".signature",
+        "token_type": "bearer",
+    }
+    return [
+        (f"inventory list ({asset_count})", assets, List[InventarioActivoOut]),
+        ("owners", owners, List[InventarioActivoOwner]),
+        ("login token", token, Token),
+    ]
+
+
+def time_per_call(func, iterations: int) -> float:
+    """Median microseconds per call over a few batches"""
+    batches = []
+    per_batch = max(1, iterations // 5)
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(per_batch):
+            func()
+        batches.append((time.perf_counter() - start) / per_batch * 1_000_000)
+    return statistics.median(batches)
+
+
+def build_app(response_class, payload, response_model) -> FastAPI:
+    app = FastAPI(default_response_class=response_class)
+
+    @app.get("/payload", response_model=response_model)
+    async def get_payload():
+        return payload
+
+    return app
+
+
+async def time_endpoint(app: FastAPI, iterations: int) -> float:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        for _ in range(5):
+            await client.get("/payload")
+        timings = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            response = await client.get("/payload")
+            timings.append((time.perf_counter() - start) * 1_000_000)
+            response.raise_for_status()
+    return statistics.median(timings)
+
+
+async def run_benchmark(asset_count: int, iterations: int):
+    print(f"⏱️  JSONResponse vs ORJSONResponse ({iterations} iterations, median µs per response)\n")
+    print(f"{'payload':<24} {'step':<9} {'stdlib':>10} {'orjson':>10} {'speedup':>8} {'bytes':>9}")
+
+    for name, payload, response_model in build_payloads(asset_count):
+        stdlib_body = JSONResponse(payload).body
+        orjson_body = ORJSONResponse(payload).body
+        assert json.loads(stdlib_body) == json.loads(orjson_body), f"{name}: different JSON"
+        # Accented keys and values must come out as UTF-8, not \u escapes
+        assert b"\\u" not in orjson_body, f"{name}: non-ASCII characters were escaped"
+
+        render_stdlib = time_per_call(lambda: JSONResponse(payload), iterations)
+        render_orjson = time_per_call(lambda: ORJSONResponse(payload), iterations)
+        endpoint_stdlib = await time_endpoint(build_app(JSONResponse, payload, response_model), iterations)
+        endpoint_orjson = await time_endpoint(build_app(ORJSONResponse, payload, response_model), iterations)
+
+        for step, stdlib_us, orjson_us in (("render", render_stdlib, render_orjson),
+                                           ("endpoint", endpoint_stdlib, endpoint_orjson)):
+            print(f"{name:<24} {step:<9} {stdlib_us:>10.1f} {orjson_us:>10.1f} "
+                  f"{stdlib_us / orjson_us:>7.2f}x {len(orjson_body):>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON response classes on realistic payloads")
+    parser.add_argument("--assets", type=int, default=1000, help="Assets in the inventory list payload")
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.assets, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark the /auth/login user lookup against a large users table.
+
+Builds a temporary copy of ``users`` (same indexes, no data touched) with N rows,
+then compares the old ``username = :x OR email = :x`` query against the
+single-column ``lower(column) = :x`` lookup used by the login endpoint.
+
+Usage:
+    python scripts/benchmark_login_lookup.py [--rows 1000000] [--lookups 2000]
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from sqlalchemy import text
+
+from src.config.database import engine
+
+OLD_QUERY = text("SELECT id FROM users_bench WHERE username = :login OR email = :login")
+NEW_USERNAME_QUERY = text("SELECT id FROM users_bench WHERE lower(username) = :login LIMIT 1")
+NEW_EMAIL_QUERY = text("SELECT id FROM users_bench WHERE lower(email) = :login LIMIT 1")
+
+
+def login_for(user_number: int) -> str:
+    """Alternate between username and email logins like real traffic"""
+    if user_number % 2:
+        return f"user{user_number}@bench.local"
+    return f"user{user_number}"
+
+
+async def populate(conn, rows: int):
+    print(f"🔧 Creando tabla temporal users_bench con {rows:,} filas...")
+    start = time.perf_counter()
+    # Explicit ids keep the real users_id_seq untouched
+    await conn.execute(text("CREATE TEMP TABLE users_bench (LIKE users INCLUDING INDEXES)"))
+    await conn.execute(
+        text(
+            "INSERT INTO users_bench (id, email, username, hashed_password, is_active, is_superuser, created_at, updated_at) "
+            "SELECT g, 'user' || g || '@bench.local', 'user' || g, 'x', true, false, now(), now() "
+            "FROM generate_series(1, :rows) AS g"
+        ),
+        {"rows": rows},
+    )
+    await conn.execute(text("ANALYZE users_bench"))
+    print(f"✅ Datos listos en {time.perf_counter() - start:.1f}s")
+
+
+async def time_queries(conn, logins, pick_query):
+    timings = []
+    for login in logins:
+        query = pick_query(login)
+        start = time.perf_counter()
+        await conn.execute(query, {"login": login})
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return {
+        "p50": statistics.median(timings),
+        "p95": timings[int(len(timings) * 0.95) - 1],
+        "mean": statistics.fmean(timings),
+    }
+
+
+async def explain(conn, query, login: str):
+    result = await conn.execute(text(f"EXPLAIN ANALYZE {query.text}"), {"login": login})
+    return "\n".join(f"    {row[0]}" for row in result)
+
+
+async def run_benchmark(rows: int, lookups: int):
+    async with engine.connect() as conn:
+        await populate(conn, rows)
+
+        logins = [login_for(random.randint(1, rows)) for _ in range(lookups)]
+        old_logins = logins
+        new_logins = [login.lower() for login in logins]
+
+        def pick_new(login: str):
+            return NEW_EMAIL_QUERY if "@" in login else NEW_USERNAME_QUERY
+
+        old_stats = await time_queries(conn, old_logins, lambda _: OLD_QUERY)
+        new_stats = await time_queries(conn, new_logins, pick_new)
+
+        print(f"\n📊 {lookups:,} lookups sobre {rows:,} filas (ms)")
+        print(f"{'query':<28} {'p50':>8} {'p95':>8} {'mean':>8}")
+        for name, stats in (("username OR email", old_stats), ("lower(column) = :x", new_stats)):
+            print(f"{name:<28} {stats['p50']:>8.3f} {stats['p95']:>8.3f} {stats['mean']:>8.3f}")
+
+        sample = login_for(rows // 2 + 1)
+        print("\n🔍 Plan (username OR email):")
+        print(await explain(conn, OLD_QUERY, sample))
+        print("\n🔍 Plan (lower(email) = :x):")
+        print(await explain(conn, pick_new(sample.lower()), sample.lower()))
+
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark login lookup queries")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--lookups", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.rows, args.lookups))
+
+
+if __name__ == "__main__":
+    main()
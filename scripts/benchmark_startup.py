@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Measure cold start: import time of ``main`` and time until the first 200 from /health.
+
+Each run spawns fresh interpreters, so nothing is cached in-process:
+
+    import      ``python -X importtime -c "import main"``; total and heaviest modules
+    first /health   uvicorn started as a subprocess, polled until /health answers 200
+
+Results are appended to ``benchmarks/startup.jsonl`` (one JSON object per run of this
+script, with the git commit) and compared with the previous entry so regressions show up.
+Only clean checkouts are recorded: a dirty tree matches no commit, so it is refused
+unless ``--allow-dirty`` is given (or ``--no-record`` to just compare).
+
+Usage:
+    python scripts/benchmark_startup.py [--runs 5] [--top 15] [--no-record] [--allow-dirty]
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import httpx
+
+project_root = Path(__file__).parent.parent
+RESULTS_FILE = project_root / "benchmarks" / "startup.jsonl"
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)")
+
+
+def measure_import(top: int):
+    """Total import time of main (ms) and the modules with the largest self time"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=project_root, capture_output=True, text=True, check=True,
+    )
+    total_us, modules = 0, []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = int(match[1]), int(match[2]), match[3], match[4]
+        modules.append((self_us, name))
+        if name == "main" and len(indent) == 1:
+            total_us = cumulative_us
+    modules.sort(reverse=True)
+    return total_us / 1000, [(name, round(self_us / 1000, 2)) for self_us, name in modules[:top]]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_first_health(timeout: float = 30.0) -> float:
+    """Milliseconds from spawning uvicorn to the first successful GET /health"""
+    port = _free_port()
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning"],
+        cwd=project_root, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        with httpx.Client(timeout=1.0) as client:
+            while time.perf_counter() - start < timeout:
+                if server.poll() is not None:
+                    raise RuntimeError(f"uvicorn exited with code {server.returncode}")
+                try:
+                    if client.get(f"http://127.0.0.1:{port}/health").status_code == 200:
+                        return (time.perf_counter() - start) * 1000
+                except httpx.TransportError:
+                    pass
+                time.sleep(0.005)
+        raise RuntimeError(f"/health did not answer within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"], cwd=project_root, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def previous_result():
+    if not RESULTS_FILE.exists():
+        return None
+    lines = [line for line in RESULTS_FILE.read_text().splitlines() if line.strip()]
+    return json.loads(lines[-1]) if lines else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark import time and time to first /health")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="Heaviest modules to report")
+    parser.add_argument("--no-record", action="store_true", help=f"Do not append to {RESULTS_FILE.name}")
+    parser.add_argument("--allow-dirty", action="store_true",
+                        help="Record even with uncommitted changes (the entry matches no commit)")
+    args = parser.parse_args()
+
+    commit = git_commit()
+    if not args.no_record and not args.allow_dirty and (commit is None or commit.endswith("-dirty")):
+        parser.error(f"working tree is {'not a git checkout' if commit is None else 'dirty'} ({commit}); "
+                     "commit first, or use --no-record / --allow-dirty")
+
+    print(f"⏱️  {args.runs} runs, DATABASE_URL={'set' if os.getenv('DATABASE_URL') else 'unset'}, "
+          f"SENTRY_DSN={'set' if os.getenv('SENTRY_DSN') else 'unset'}")
+
+    import_times, health_times, top_modules = [], [], []
+    for _ in range(args.runs):
+        import_ms, top_modules = measure_import(args.top)
+        import_times.append(import_ms)
+        health_times.append(measure_first_health())
+
+    result = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "runs": args.runs,
+        "database_configured": bool(os.getenv("DATABASE_URL")),
+        "import_ms_median": round(statistics.median(import_times), 1),
+        "import_ms_min": round(min(import_times), 1),
+        "first_health_ms_median": round(statistics.median(health_times), 1),
+        "first_health_ms_min": round(min(health_times), 1),
+        "top_modules_self_ms": top_modules,
+    }
+
+    print(f"\n📦 import main:     median {result['import_ms_median']} ms (min {result['import_ms_min']} ms)")
+    print(f"🩺 first /health:   median {result['first_health_ms_median']} ms (min {result['first_health_ms_min']} ms)")
+    print("\nHeaviest modules (self time, last run):")
+    for name, self_ms in top_modules:
+        print(f"   {self_ms:8.2f} ms  {name}")
+
+    previous = previous_result()
+    if previous:
+        for key in ("import_ms_median", "first_health_ms_median"):
+            change = result[key] - previous[key]
+            print(f"\nΔ {key}: {change:+.1f} ms vs {previous.get('commit')} ({previous[key]} ms)", end="")
+        print()
+
+    if not args.no_record:
+        RESULTS_FILE.parent.mkdir(exist_ok=True)
+        with RESULTS_FILE.open("a") as results:
+            results.write(json.dumps(result, ensure_ascii=False) + "\n")
+        print(f"\n📝 Recorded in {RESULTS_FILE.relative_to(project_root)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Calibrate bcrypt cost for this host.
+
+Benchmarks password verification at increasing bcrypt rounds and recommends the
+highest BCRYPT_ROUNDS value whose median verify latency stays under the target.
+
+Usage:
+    python scripts/calibrate_bcrypt.py [--target-ms 250] [--min-rounds 10] [--max-rounds 15] [--samples 5]
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from passlib.context import CryptContext
+
+SAMPLE_PASSWORD = "calibration-password-123"
+
+
+def measure_verify_ms(rounds: int, samples: int) -> float:
+    """Return the median verify latency in milliseconds for the given rounds"""
+    context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=rounds)
+    hashed = context.hash(SAMPLE_PASSWORD)
+
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        context.verify(SAMPLE_PASSWORD, hashed)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(timings)
+
+
+def calibrate(target_ms: float, min_rounds: int, max_rounds: int, samples: int) -> int:
+    """Benchmark each rounds value and return the recommended one"""
+    print(f"🔧 Calibrando bcrypt (objetivo: {target_ms:.0f} ms por verificación)")
+    print(f"{'rounds':>8} {'mediana (ms)':>14}")
+
+    recommended = min_rounds
+    for rounds in range(min_rounds, max_rounds + 1):
+        median_ms = measure_verify_ms(rounds, samples)
+        marker = "✅" if median_ms <= target_ms else "❌"
+        print(f"{rounds:>8} {median_ms:>14.1f} {marker}")
+
+        if median_ms > target_ms:
+            # Cost doubles with every round, no need to keep going
+            break
+        recommended = rounds
+
+    return recommended
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calibrate bcrypt rounds for this host")
+    parser.add_argument("--target-ms", type=float, default=250.0, help="Target verify latency in milliseconds")
+    parser.add_argument("--min-rounds", type=int, default=10, help="Lowest rounds value to consider")
+    parser.add_argument("--max-rounds", type=int, default=15, help="Highest rounds value to consider")
+    parser.add_argument("--samples", type=int, default=5, help="Verifications per rounds value")
+    args = parser.parse_args()
+
+    if not 4 <= args.min_rounds <= args.max_rounds <= 31:
+        print("❌ Rounds must satisfy 4 <= min-rounds <= max-rounds <= 31")
+        sys.exit(1)
+
+    recommended = calibrate(args.target_ms, args.min_rounds, args.max_rounds, args.samples)
+
+    print("\n📋 Recomendación:")
+    print(f"BCRYPT_ROUNDS={recommended}")
+    print("\nLos hashes existentes se actualizan automáticamente en el siguiente login exitoso.")
+
+
+if __name__ == "__main__":
+    main()
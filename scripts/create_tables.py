@@ -8,20 +8,15 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.config.database import engine
-from src.models.user import User
+from src.config.migrations import run_migrations
 
 async def create_tables():
-    """Create all tables in the database"""
+    """Create all tables in the database (applies pending migrations, see migrate.py)"""
     print("🔧 Creando tablas en la base de datos...")
     
     try:
-        # Import all models to ensure they are registered
-        from src.models import user  # This ensures User model is imported
-        
-        # Create all tables
-        async with engine.begin() as conn:
-            from src.config.database import Base
-            await conn.run_sync(Base.metadata.create_all)
+        for migration in await run_migrations():
+            print(f"   {migration.version}: {migration.description}")
         
         print("✅ Tablas creadas exitosamente")
         return True
@@ -29,10 +24,12 @@ async def create_tables():
     except Exception as e:
         print(f"❌ Error creando tablas: {e}")
         return False
+    finally:
+        await engine.dispose()
 
 if __name__ == "__main__":
     success = asyncio.run(create_tables())
     if success:
         print("✅ Base de datos lista para usar")
     else:
-        print("❌ Error en la configuración de base de datos")
\ No newline at end of file
+        print("❌ Error en la configuración de base de datos")
@@ -3,89 +3,20 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List
 
-# Lista de propietarios de activos
-PROPIETARIOS_ACTIVOS = [
-    "Jefe Oficina de Control Interno ",
-    "Subdirección Financiera y Administrativa ",
-    "Asesor de la Dirección para Comunicaciones y Servicio al Ciudadano",
-    "Oficina de Control Disciplinario Interno",
-    "Profesional Gestión Financiera",
-    "Responsable Área de Contabilidad",
-    "Responsable Área Cesantías",
-    "Jefe de la Oficina Asesora de Planeación",
-    "Profesional Universitario Grado 19 - AHL",
-    "Jefe Oficina de Informática y Sistemas ",
-    "Profesional especializado Subdirección de Prestaciones Económicas",
-    "Profesional Subdirección de Prestaciones Económicas",
-    "Profesional y Profesional especializado Subdirección de Prestaciones Económicas",
-    "Técnico Operativo Subdirección de Prestaciones Económicas",
-    "Gerencia de Pensiones",
-    "Jefe Oficina Asesora de Jurídica",
-    "Responsable Área Administrativa",
-    "Jefe Oficina de Informática y Sistemas",
-    "Responsable Área Talento Humano",
-    "Responsable Área de Cartera y Jurisdicción coactiva",
-    "Técnico operativo del Área de Cartera y Jurisdicción coactiva",
-    "Profesional universitario y Técnico operativo del Área de Cartera y Jurisdicción coactiva",
-    " Técnico operativo del Área de Cartera y Jurisdicción coactiva",
-    "Profesionales Universitarios Jurisdicción coactiva",
-    "Responsable Área Cesantías ",
-    "Profesional Especializado Subdirección de Prestaciones Económicas",
-    "Profesionales Subdirección de Prestaciones Económicas",
-    "Técnico operativo Subdirección de Prestaciones Económicas",
-    "Departamento de TI"
-]
-
-def create_username_from_dueno(dueno: str) -> str:
-    """Create a username from the dueno_de_activo string"""
-    # Remove extra spaces and convert to lowercase
-    clean_dueno = dueno.strip().lower()
-    
-    # Replace spaces and special characters with underscores
-    username = (clean_dueno
-                .replace(" ", "_")
-                .replace("ñ", "n")
-                .replace("ó", "o")
-                .replace("é", "e")
-                .replace("í", "i")
-                .replace("á", "a")
-                .replace("ú", "u")
-                .replace(".", "")
-                .replace(",", "")
-                .replace("-", "_"))
-    
-    # Remove multiple underscores
-    while "__" in username:
-        username = username.replace("__", "_")
-    
-    # Remove leading/trailing underscores
-    username = username.strip("_")
-    
-    return username
-
-def create_email_from_username(username: str) -> str:
-    """Create an email from username"""
-    return f"{username}@inventario.gov.co"
+from user_catalog import admin_user, propietario_users
 
 def generate_credentials() -> Dict:
     """Generate credentials for all users without database"""
-    # Remove duplicates while preserving order
-    unique_propietarios = []
-    seen = set()
-    for prop in PROPIETARIOS_ACTIVOS:
-        clean_prop = prop.strip()
-        if clean_prop not in seen:
-            seen.add(clean_prop)
-            unique_propietarios.append(clean_prop)
-    
-    print(f"Generating credentials for {len(unique_propietarios)} unique propietarios...")
+    users = propietario_users()
+    print(f"Generating credentials for {len(users)} unique propietarios...")
     
+    admin = admin_user()
     credentials = {
         "admin": {
-            "email": "admin@inventario.gov.co",
-            "username": "admin",
-            "password": "admin123",
-            "full_name": "Administrador Principal",
+            "email": admin["email"],
+            "username": admin["username"],
+            "password": admin["password"],
+            "full_name": admin["full_name"],
             "dueno_de_activo": None,
             "is_superuser": True,
             "role": "admin"
@@ -94,29 +25,18 @@ def generate_credentials() -> Dict:
     }
     
     # Create credentials for each propietario
-    for idx, dueno in enumerate(unique_propietarios, 1):
-        try:
-            username = create_username_from_dueno(dueno)
-            email = create_email_from_username(username)
-            default_password = "password123"
-            
-            user_credential = {
-                "id": idx,
-                "email": email,
-                "username": username,
-                "password": default_password,
-                "full_name": dueno,
-                "dueno_de_activo": dueno,
-                "is_superuser": False,
-                "role": "user"
-            }
-            
-            credentials["users"].append(user_credential)
-            print(f"✓ Generated credentials for: {username} ({email}) - '{dueno}'")
-            
-        except Exception as e:
-            print(f"✗ Error generating credentials for '{dueno}': {e}")
-            continue
+    for idx, user in enumerate(users, 1):
+        credentials["users"].append({
+            "id": idx,
+            "email": user["email"],
+            "username": user["username"],
+            "password": user["password"],
+            "full_name": user["full_name"],
+            "dueno_de_activo": user["dueno_de_activo"],
+            "is_superuser": False,
+            "role": "user"
+        })
+        print(f"✓ Generated credentials for: {user['username']} ({user['email']}) - '{user['dueno_de_activo']}'")
     
     return credentials
 
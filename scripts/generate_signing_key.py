@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Generate a new JWT signing key for RS256 or EdDSA.
+
+Writes <kid>.pem (private key) into JWT_KEYS_DIR. To rotate keys:
+  1. Run this script to add the new key
+  2. Set JWT_ACTIVE_KEY_ID=<kid> and restart the gateway
+  3. Once tokens signed by the old key have expired, replace the old <kid>.pem
+     with its public half (--retire <kid>) or delete it
+
+Usage:
+    python scripts/generate_signing_key.py --algorithm EdDSA [--kid 2025-10] [--dir keys]
+    python scripts/generate_signing_key.py --retire <kid> [--dir keys]
+"""
+import argparse
+import os
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+
+
+def generate_private_key(algorithm: str):
+    """Create a private key suitable for the given JWT algorithm"""
+    if algorithm == "EdDSA":
+        return ed25519.Ed25519PrivateKey.generate()
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def write_private_key(keys_dir: Path, kid: str, algorithm: str) -> Path:
+    private_key = generate_private_key(algorithm)
+    pem = private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+    path = keys_dir / f"{kid}.pem"
+    path.write_bytes(pem)
+    os.chmod(path, 0o600)
+    return path
+
+
+def retire_key(keys_dir: Path, kid: str) -> Path:
+    """Replace a private key with its public half so it only verifies old tokens"""
+    private_path = keys_dir / f"{kid}.pem"
+    private_key = serialization.load_pem_private_key(private_path.read_bytes(), password=None)
+    public_pem = private_key.public_key().public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    public_path = keys_dir / f"{kid}.pub.pem"
+    public_path.write_bytes(public_pem)
+    private_path.unlink()
+    return public_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate or retire JWT signing keys")
+    parser.add_argument("--algorithm", choices=["RS256", "EdDSA"], default="EdDSA")
+    parser.add_argument("--kid", default=datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S"))
+    parser.add_argument("--dir", default=os.getenv("JWT_KEYS_DIR", "keys"))
+    parser.add_argument("--retire", metavar="KID", help="Keep only the public half of an existing key")
+    args = parser.parse_args()
+
+    keys_dir = Path(args.dir)
+    keys_dir.mkdir(parents=True, exist_ok=True)
+
+    if args.retire:
+        if not (keys_dir / f"{args.retire}.pem").exists():
+            print(f"❌ Key not found: {keys_dir / (args.retire + '.pem')}")
+            sys.exit(1)
+        path = retire_key(keys_dir, args.retire)
+        print(f"✅ Key '{args.retire}' retired, public key kept at {path}")
+        return
+
+    if (keys_dir / f"{args.kid}.pem").exists():
+        print(f"❌ Key '{args.kid}' already exists in {keys_dir}")
+        sys.exit(1)
+
+    path = write_private_key(keys_dir, args.kid, args.algorithm)
+    print(f"✅ {args.algorithm} key created: {path}")
+    print("\n📋 Configure the gateway with:")
+    print(f"JWT_ALGORITHM={args.algorithm}")
+    print(f"JWT_KEYS_DIR={keys_dir}")
+    print(f"JWT_ACTIVE_KEY_ID={args.kid}")
+
+
+if __name__ == "__main__":
+    main()
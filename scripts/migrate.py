@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Apply pending schema migrations (src/config/migrations.py).
+
+Runs as the Railway pre-deploy command / Procfile release phase, so the gateway
+itself never executes DDL at startup.
+
+Usage:
+    python scripts/migrate.py            # apply pending migrations
+    python scripts/migrate.py --status   # show applied and expected versions
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from src.config.database import engine
+from src.config.migrations import MIGRATIONS, SCHEMA_VERSION, get_schema_version, run_migrations
+
+
+async def migrate(status_only: bool) -> bool:
+    try:
+        current = await get_schema_version()
+        print(f"📋 Versión del esquema: {current} (esperada: {SCHEMA_VERSION})")
+        if status_only:
+            for migration in MIGRATIONS:
+                mark = "✅" if migration.version <= current else "⏳"
+                print(f"   {mark} {migration.version}: {migration.description}")
+            return current >= SCHEMA_VERSION
+
+        if current >= SCHEMA_VERSION:
+            print("✅ Esquema al día, nada que aplicar")
+            return True
+
+        start = time.perf_counter()
+        for migration in await run_migrations():
+            print(f"✅ {migration.version}: {migration.description}")
+        print(f"🎉 Migraciones aplicadas en {time.perf_counter() - start:.2f}s")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error aplicando migraciones: {e}")
+        return False
+    finally:
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply pending schema migrations")
+    parser.add_argument("--status", action="store_true", help="Only show the applied version")
+    args = parser.parse_args()
+    success = asyncio.run(migrate(args.status))
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Provisionamiento masivo de usuarios.
+
+Lee usuarios en streaming desde CSV, JSON o JSON Lines, calcula los hashes bcrypt en
+un pool de procesos y los carga con COPY a una tabla temporal seguida de un único
+INSERT ... SELECT ... ON CONFLICT DO NOTHING por lote. Los usuarios existentes
+(mismo email o username) se omiten, no se modifican.
+
+Columnas/campos reconocidos: email, username, password, full_name, dueno_de_activo,
+is_active, is_superuser (otros campos, p. ej. "role", se ignoran). Los usernames con "@"
+se omiten, igual que en /auth/register: el login los buscaría como email.
+
+Usage:
+    python scripts/provision_users.py users.csv
+    python scripts/provision_users.py users.jsonl --workers 8 --batch-size 5000
+    python scripts/provision_users.py --defaults          # admin + un usuario por propietario
+
+Costo: cada hash cuesta ~2^BCRYPT_ROUNDS. Para cargas de 100k+ cuentas con contraseñas
+temporales se puede usar --rounds más bajo; el login actualiza el hash al costo
+configurado (BCRYPT_ROUNDS) la primera vez que el usuario inicia sesión.
+"""
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from dotenv import load_dotenv
+load_dotenv()
+
+import psycopg
+from passlib.context import CryptContext
+
+from src.schemas.auth import USERNAME_PATTERN
+from user_catalog import default_users
+
+COLUMNS = ("email", "username", "hashed_password", "full_name", "dueno_de_activo", "is_active", "is_superuser")
+
+CREATE_STAGING_SQL = """
+CREATE TEMP TABLE IF NOT EXISTS users_staging (
+    email VARCHAR NOT NULL,
+    username VARCHAR NOT NULL,
+    hashed_password VARCHAR NOT NULL,
+    full_name VARCHAR,
+    dueno_de_activo VARCHAR,
+    is_active BOOLEAN NOT NULL,
+    is_superuser BOOLEAN NOT NULL
+)
+"""
+
+COPY_SQL = f"COPY users_staging ({', '.join(COLUMNS)}) FROM STDIN"
+
+UPSERT_SQL = f"""
+INSERT INTO users ({', '.join(COLUMNS)})
+SELECT {', '.join(COLUMNS)} FROM users_staging
+ON CONFLICT DO NOTHING
+"""
+
+TRUE_VALUES = {"1", "true", "t", "yes", "y", "si", "sí"}
+
+# Per-process hashing context, created once in each pool worker
+_worker_context: Optional[CryptContext] = None
+
+
+def _init_worker(rounds: int):
+    global _worker_context
+    _worker_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=rounds)
+
+
+def _hash_chunk(passwords: List[str]) -> List[str]:
+    return [_worker_context.hash(password) for password in passwords]
+
+
+def parse_bool(value, default: bool) -> bool:
+    if value is None or value == "":
+        return default
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in TRUE_VALUES
+
+
+def normalize_user(record: Dict) -> Optional[Dict]:
+    """Map an input record to the users table columns (without the hash yet)"""
+    email = (record.get("email") or "").strip()
+    username = (record.get("username") or "").strip()
+    password = record.get("password") or ""
+    if not email or not username or not password:
+        return None
+    # Same rule as UserCreate: a username with "@" would be looked up as an email at login
+    if not re.match(USERNAME_PATTERN, username):
+        return None
+    return {
+        "email": email,
+        "username": username,
+        "password": password,
+        "full_name": record.get("full_name") or None,
+        "dueno_de_activo": record.get("dueno_de_activo") or None,
+        "is_active": parse_bool(record.get("is_active"), True),
+        "is_superuser": parse_bool(record.get("is_superuser"), False),
+    }
+
+
+def read_records(path: Path) -> Iterator[Dict]:
+    """Stream raw records from CSV, JSON Lines or JSON"""
+    suffix = path.suffix.lower()
+    with open(path, encoding="utf-8", newline="") as f:
+        if suffix == ".csv":
+            yield from csv.DictReader(f)
+        elif suffix in (".jsonl", ".ndjson"):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            data = json.load(f)
+            # Accept the formats written by generate_credentials.py and create_users.py
+            if isinstance(data, dict):
+                if "credentials" in data:
+                    data = data["credentials"]
+                else:
+                    data = ([data["admin"]] if data.get("admin") else []) + data.get("users", [])
+            yield from data
+
+
+def batched(iterable: Iterable, size: int) -> Iterator[List]:
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def hashed_batches(users: Iterable[Dict], executor: ProcessPoolExecutor, batch_size: int,
+                   chunk_size: int, window: int) -> Iterator[Tuple[List[Dict], List[str]]]:
+    """
+    Yield (users, hashes) per batch while the pool keeps hashing the following batches.
+    At most `window` batches are in flight, so memory stays bounded for any input size.
+    """
+    pending = []
+    for batch in batched(users, batch_size):
+        passwords = [user["password"] for user in batch]
+        futures = [
+            executor.submit(_hash_chunk, passwords[i:i + chunk_size])
+            for i in range(0, len(passwords), chunk_size)
+        ]
+        pending.append((batch, futures))
+        if len(pending) >= window:
+            batch, futures = pending.pop(0)
+            yield batch, [h for future in futures for h in future.result()]
+    for batch, futures in pending:
+        yield batch, [h for future in futures for h in future.result()]
+
+
+def get_conninfo() -> str:
+    # The staging temp table outlives a transaction, so bypass PgBouncer when possible
+    database_url = os.getenv("DATABASE_DIRECT_URL") or os.getenv("DATABASE_URL")
+    if not database_url:
+        print("❌ DATABASE_URL no encontrada en variables de entorno")
+        sys.exit(1)
+    # psycopg expects a plain libpq URL
+    return database_url.replace("postgresql+psycopg://", "postgresql://")
+
+
+def provision(users: Iterable[Dict], workers: int, batch_size: int, rounds: int) -> Dict[str, int]:
+    """Hash and load users; returns processed/inserted/skipped counters"""
+    stats = {"processed": 0, "inserted": 0, "skipped": 0}
+    chunk_size = max(1, min(256, batch_size // (workers * 4) or 1))
+    start = time.perf_counter()
+
+    with psycopg.connect(get_conninfo()) as conn, \
+            ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(rounds,)) as executor:
+        with conn.cursor() as cur:
+            cur.execute(CREATE_STAGING_SQL)
+
+            for batch, hashes in hashed_batches(users, executor, batch_size, chunk_size, window=2):
+                with cur.copy(COPY_SQL) as copy:
+                    for user, hashed_password in zip(batch, hashes):
+                        copy.write_row((
+                            user["email"],
+                            user["username"],
+                            hashed_password,
+                            user["full_name"],
+                            user["dueno_de_activo"],
+                            user["is_active"],
+                            user["is_superuser"],
+                        ))
+                cur.execute(UPSERT_SQL)
+                inserted = cur.rowcount
+                cur.execute("TRUNCATE users_staging")
+                conn.commit()
+
+                stats["processed"] += len(batch)
+                stats["inserted"] += inserted
+                stats["skipped"] += len(batch) - inserted
+                elapsed = time.perf_counter() - start
+                print(
+                    f"⏳ {stats['processed']:,} procesados | {stats['inserted']:,} creados | "
+                    f"{stats['skipped']:,} existentes | {stats['processed'] / elapsed:,.0f} filas/s"
+                )
+
+    stats["elapsed"] = time.perf_counter() - start
+    return stats
+
+
+def load_users(source: Optional[Path], use_defaults: bool) -> Iterator[Dict]:
+    records = default_users() if use_defaults else read_records(source)
+    invalid = 0
+    for record in records:
+        user = normalize_user(record)
+        if user is None:
+            invalid += 1
+            continue
+        yield user
+    if invalid:
+        print(f"⚠️  {invalid} registros sin email, username o password (o con \"@\" en el username) fueron omitidos")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Provision users from CSV/JSON into the users table")
+    parser.add_argument("source", nargs="?", type=Path, help="CSV, JSON or JSON Lines file")
+    parser.add_argument("--defaults", action="store_true", help="Provision the built-in admin + propietario users")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Hashing processes")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Rows per COPY/INSERT batch")
+    parser.add_argument("--rounds", type=int, default=int(os.getenv("BCRYPT_ROUNDS", "12")),
+                        help="bcrypt rounds for the new hashes (default: BCRYPT_ROUNDS)")
+    args = parser.parse_args()
+
+    if not args.defaults and args.source is None:
+        parser.error("provide a source file or --defaults")
+    if args.source is not None and not args.source.exists():
+        parser.error(f"file not found: {args.source}")
+
+    print("🚀 Provisionando usuarios...")
+    print(f"   Workers: {args.workers} | Lote: {args.batch_size} | bcrypt rounds: {args.rounds}")
+
+    stats = provision(load_users(args.source, args.defaults), args.workers, args.batch_size, args.rounds)
+
+    rate = stats["processed"] / stats["elapsed"] if stats["elapsed"] else 0
+    print("\n📊 Resumen:")
+    print(f"   ✅ Creados: {stats['inserted']:,}")
+    print(f"   ⚠️  Existentes: {stats['skipped']:,}")
+    print(f"   ⏱️  {stats['elapsed']:.1f}s ({rate:,.0f} filas/s)")
+
+
+if __name__ == "__main__":
+    main()
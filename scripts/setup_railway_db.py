@@ -97,6 +97,7 @@ async def create_tables_railway():
             dueno_de_activo VARCHAR,
             is_active BOOLEAN DEFAULT TRUE NOT NULL,
             is_superuser BOOLEAN DEFAULT FALSE NOT NULL,
+            can_introspect BOOLEAN DEFAULT FALSE NOT NULL,
             created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
             updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL
         );
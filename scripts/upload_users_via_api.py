@@ -3,97 +3,87 @@ import asyncio
 import httpx
 from pathlib import Path
 from datetime import datetime
+from typing import List, Optional, Tuple
+
+from user_catalog import admin_user, propietario_users
 
 API_BASE_URL = "http://127.0.0.1:8000"
 
-# Lista de propietarios de activos
-PROPIETARIOS_ACTIVOS = [
-    "Jefe Oficina de Control Interno ",
-    "Subdirección Financiera y Administrativa ",
-    "Asesor de la Dirección para Comunicaciones y Servicio al Ciudadano",
-    "Oficina de Control Disciplinario Interno",
-    "Profesional Gestión Financiera",
-    "Responsable Área de Contabilidad",
-    "Responsable Área Cesantías",
-    "Jefe de la Oficina Asesora de Planeación",
-    "Profesional Universitario Grado 19 - AHL",
-    "Jefe Oficina de Informática y Sistemas ",
-    "Profesional especializado Subdirección de Prestaciones Económicas",
-    "Profesional Subdirección de Prestaciones Económicas",
-    "Profesional y Profesional especializado Subdirección de Prestaciones Económicas",
-    "Técnico Operativo Subdirección de Prestaciones Económicas",
-    "Gerencia de Pensiones",
-    "Jefe Oficina Asesora de Jurídica",
-    "Responsable Área Administrativa",
-    "Jefe Oficina de Informática y Sistemas",
-    "Responsable Área Talento Humano",
-    "Responsable Área de Cartera y Jurisdicción coactiva",
-    "Técnico operativo del Área de Cartera y Jurisdicción coactiva",
-    "Profesional universitario y Técnico operativo del Área de Cartera y Jurisdicción coactiva",
-    " Técnico operativo del Área de Cartera y Jurisdicción coactiva",
-    "Profesionales Universitarios Jurisdicción coactiva",
-    "Responsable Área Cesantías ",
-    "Profesional Especializado Subdirección de Prestaciones Económicas",
-    "Profesionales Subdirección de Prestaciones Económicas",
-    "Técnico operativo Subdirección de Prestaciones Económicas",
-    "Departamento de TI"
-]
+# Users per request to POST /auth/register/bulk
+BULK_BATCH_SIZE = 500
 
-def create_username_from_dueno(dueno: str) -> str:
-    """Create a username from the dueno_de_activo string"""
-    clean_dueno = dueno.strip().lower()
-    
-    username = (clean_dueno
-                .replace(" ", "_")
-                .replace("ñ", "n")
-                .replace("ó", "o")
-                .replace("é", "e")
-                .replace("í", "i")
-                .replace("á", "a")
-                .replace("ú", "u")
-                .replace(".", "")
-                .replace(",", "")
-                .replace("-", "_"))
-    
-    while "__" in username:
-        username = username.replace("__", "_")
-    
-    username = username.strip("_")
-    return username
+async def register_user_via_api(client: httpx.AsyncClient, user_data: dict) -> bool:
+    """Register a user using the API endpoint"""
+    try:
+        response = await client.post(
+            f"{API_BASE_URL}/auth/register",
+            json=user_data,
+            timeout=30.0
+        )
+        
+        if response.status_code == 201:
+            print(f"✅ Usuario creado: {user_data['username']} ({user_data['email']})")
+            return True
+        elif response.status_code == 400:
+            error_detail = response.json().get("detail", "Error desconocido")
+            if "already registered" in str(error_detail).lower():
+                print(f"⚠️  Usuario ya existe: {user_data['username']}")
+                return True  # Consider existing as success
+            else:
+                print(f"❌ Error registrando {user_data['username']}: {error_detail}")
+                return False
+        else:
+            print(f"❌ Error registrando {user_data['username']}: HTTP {response.status_code}")
+            print(f"   Respuesta: {response.text}")
+            return False
+            
+    except Exception as e:
+        print(f"❌ Error de conexión registrando {user_data['username']}: {str(e)}")
+        return False
 
-def create_email_from_username(username: str) -> str:
-    """Create an email from username"""
-    return f"{username}@inventario.gov.co"
+async def get_admin_token(client: httpx.AsyncClient, username: str, password: str) -> Optional[str]:
+    """Login as admin to use the bulk registration endpoint"""
+    try:
+        response = await client.post(
+            f"{API_BASE_URL}/auth/login",
+            json={"username": username, "password": password},
+            timeout=30.0
+        )
+        if response.status_code == 200:
+            return response.json()["access_token"]
+        print(f"⚠️  Login de admin falló: HTTP {response.status_code}")
+    except Exception as e:
+        print(f"⚠️  Error de conexión en login de admin: {str(e)}")
+    return None
 
-async def register_user_via_api(user_data: dict) -> bool:
-    """Register a user using the API endpoint"""
-    async with httpx.AsyncClient() as client:
+async def register_users_bulk_via_api(client: httpx.AsyncClient, token: str, users: List[dict]) -> Tuple[int, int]:
+    """Register users in batches using the admin-only bulk endpoint"""
+    successful, failed = 0, 0
+    for start in range(0, len(users), BULK_BATCH_SIZE):
+        batch = users[start:start + BULK_BATCH_SIZE]
         try:
             response = await client.post(
-                f"{API_BASE_URL}/auth/register",
-                json=user_data,
-                timeout=30.0
+                f"{API_BASE_URL}/auth/register/bulk",
+                json={"users": batch},
+                headers={"Authorization": f"Bearer {token}"},
+                timeout=120.0
             )
+            if response.status_code != 200:
+                print(f"❌ Error en lote {start // BULK_BATCH_SIZE + 1}: HTTP {response.status_code}")
+                print(f"   Respuesta: {response.text}")
+                failed += len(batch)
+                continue
             
-            if response.status_code == 201:
-                print(f"✅ Usuario creado: {user_data['username']} ({user_data['email']})")
-                return True
-            elif response.status_code == 400:
-                error_detail = response.json().get("detail", "Error desconocido")
-                if "already registered" in str(error_detail).lower():
-                    print(f"⚠️  Usuario ya existe: {user_data['username']}")
-                    return True  # Consider existing as success
+            for result in response.json()["results"]:
+                if result["status"] == "created":
+                    print(f"✅ Usuario creado: {result['username']} ({result['email']})")
                 else:
-                    print(f"❌ Error registrando {user_data['username']}: {error_detail}")
-                    return False
-            else:
-                print(f"❌ Error registrando {user_data['username']}: HTTP {response.status_code}")
-                print(f"   Respuesta: {response.text}")
-                return False
-                
+                    print(f"⚠️  Usuario ya existe: {result['username']}")
+                successful += 1
         except Exception as e:
-            print(f"❌ Error de conexión registrando {user_data['username']}: {str(e)}")
-            return False
+            print(f"❌ Error de conexión en lote {start // BULK_BATCH_SIZE + 1}: {str(e)}")
+            failed += len(batch)
+    return successful, failed
 
 async def check_server_availability() -> bool:
     """Check if the FastAPI server is running"""
@@ -118,67 +108,35 @@ async def upload_users_to_database():
     
     print("✅ Servidor disponible")
     
-    # Remove duplicates
-    unique_propietarios = []
-    seen = set()
-    for prop in PROPIETARIOS_ACTIVOS:
-        clean_prop = prop.strip()
-        if clean_prop not in seen:
-            seen.add(clean_prop)
-            unique_propietarios.append(clean_prop)
-    
-    print(f"\n👥 Creando {len(unique_propietarios)} usuarios únicos + 1 admin...")
-    
-    # Create admin user first
-    admin_data = {
-        "email": "admin@inventario.gov.co",
-        "username": "admin",
-        "password": "admin123",
-        "full_name": "Administrador Principal",
-        "dueno_de_activo": None,
-        "is_superuser": True,
-        "is_active": True
-    }
-    
-    print(f"\n👑 Creando usuario administrador...")
-    admin_success = await register_user_via_api(admin_data)
-    
-    # Create regular users
-    print(f"\n👤 Creando usuarios por propietario...")
-    successful_users = 0
-    failed_users = 0
+    admin_data = admin_user()
+    users = propietario_users()
+    print(f"\n👥 Creando {len(users)} usuarios únicos + 1 admin...")
     
-    for dueno in unique_propietarios:
-        try:
-            username = create_username_from_dueno(dueno)
-            email = create_email_from_username(username)
-            
-            user_data = {
-                "email": email,
-                "username": username,
-                "password": "password123",
-                "full_name": dueno,
-                "dueno_de_activo": dueno,
-                "is_superuser": False,
-                "is_active": True
-            }
-            
-            success = await register_user_via_api(user_data)
-            if success:
-                successful_users += 1
-            else:
-                failed_users += 1
-                
-        except Exception as e:
-            print(f"❌ Error procesando '{dueno}': {e}")
-            failed_users += 1
+    # One client (and connection pool) for the whole upload
+    async with httpx.AsyncClient() as client:
+        print(f"\n👑 Creando usuario administrador...")
+        admin_success = await register_user_via_api(client, admin_data)
+        
+        token = await get_admin_token(client, admin_data["username"], admin_data["password"])
+        if token:
+            print(f"\n👤 Creando {len(users)} usuarios con /auth/register/bulk...")
+            successful_users, failed_users = await register_users_bulk_via_api(client, token, users)
+        else:
+            print(f"\n👤 Creando usuarios uno por uno...")
+            successful_users = 0
+            failed_users = 0
+            for user_data in users:
+                if await register_user_via_api(client, user_data):
+                    successful_users += 1
+                else:
+                    failed_users += 1
     
     # Summary
     total_users = successful_users + (1 if admin_success else 0)
     print(f"\n📊 Resumen de carga:")
     print(f"   ✅ Usuarios creados exitosamente: {total_users}")
     print(f"   ❌ Errores: {failed_users}")
-    print(f"   📝 Total procesados: {len(unique_propietarios) + 1}")
+    print(f"   📝 Total procesados: {len(users) + 1}")
     
     if total_users > 0:
         print(f"\n🔑 Credenciales de acceso:")
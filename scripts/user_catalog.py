@@ -0,0 +1,121 @@
+"""
+Catálogo de usuarios por defecto (un usuario por propietario de activo + admin).
+
+Compartido por create_users.py, generate_credentials.py, upload_users_via_api.py y
+provision_users.py para que la lista y las reglas de nombres estén en un solo lugar.
+"""
+from typing import Dict, List
+
+ADMIN_PASSWORD = "admin123"  # You should change this in production
+DEFAULT_PASSWORD = "password123"  # You should change this system in production
+
+# Lista de propietarios de activos
+PROPIETARIOS_ACTIVOS = [
+    "Jefe Oficina de Control Interno ",
+    "Subdirección Financiera y Administrativa ",
+    "Asesor de la Dirección para Comunicaciones y Servicio al Ciudadano",
+    "Oficina de Control Disciplinario Interno",
+    "Profesional Gestión Financiera",
+    "Responsable Área de Contabilidad",
+    "Responsable Área Cesantías",
+    "Jefe de la Oficina Asesora de Planeación",
+    "Profesional Universitario Grado 19 - AHL",
+    "Jefe Oficina de Informática y Sistemas ",
+    "Profesional especializado Subdirección de Prestaciones Económicas",
+    "Profesional Subdirección de Prestaciones Económicas",
+    "Profesional y Profesional especializado Subdirección de Prestaciones Económicas",
+    "Técnico Operativo Subdirección de Prestaciones Económicas",
+    "Gerencia de Pensiones",
+    "Jefe Oficina Asesora de Jurídica",
+    "Responsable Área Administrativa",
+    "Jefe Oficina de Informática y Sistemas",
+    "Responsable Área Talento Humano",
+    "Responsable Área de Cartera y Jurisdicción coactiva",
+    "Técnico operativo del Área de Cartera y Jurisdicción coactiva",
+    "Profesional universitario y Técnico operativo del Área de Cartera y Jurisdicción coactiva",
+    " Técnico operativo del Área de Cartera y Jurisdicción coactiva",
+    "Profesionales Universitarios Jurisdicción coactiva",
+    "Responsable Área Cesantías ",
+    "Profesional Especializado Subdirección de Prestaciones Económicas",
+    "Profesionales Subdirección de Prestaciones Económicas",
+    "Técnico operativo Subdirección de Prestaciones Económicas",
+    "Departamento de TI"
+]
+
+def create_username_from_dueno(dueno: str) -> str:
+    """Create a username from the dueno_de_activo string"""
+    # Remove extra spaces and convert to lowercase
+    clean_dueno = dueno.strip().lower()
+    
+    # Replace spaces and special characters with underscores
+    username = (clean_dueno
+                .replace(" ", "_")
+                .replace("ñ", "n")
+                .replace("ó", "o")
+                .replace("é", "e")
+                .replace("í", "i")
+                .replace("á", "a")
+                .replace("ú", "u")
+                .replace(".", "")
+                .replace(",", "")
+                .replace("-", "_"))
+    
+    # Remove multiple underscores
+    while "__" in username:
+        username = username.replace("__", "_")
+    
+    # Remove leading/trailing underscores
+    username = username.strip("_")
+    
+    return username
+
+def create_email_from_username(username: str) -> str:
+    """Create an email from username"""
+    return f"{username}@inventario.gov.co"
+
+
+def unique_propietarios() -> List[str]:
+    """Remove duplicates (ignoring surrounding spaces) while preserving order"""
+    unique = []
+    seen = set()
+    for prop in PROPIETARIOS_ACTIVOS:
+        clean_prop = prop.strip()
+        if clean_prop not in seen:
+            seen.add(clean_prop)
+            unique.append(clean_prop)
+    return unique
+
+
+def admin_user() -> Dict:
+    """Default admin account (can see all assets)"""
+    return {
+        "email": "admin@inventario.gov.co",
+        "username": "admin",
+        "password": ADMIN_PASSWORD,
+        "full_name": "Administrador Principal",
+        "dueno_de_activo": None,  # Admin can see everything
+        "is_active": True,
+        "is_superuser": True,
+    }
+
+
+def propietario_users() -> List[Dict]:
+    """One regular account per unique propietario"""
+    users = []
+    for dueno in unique_propietarios():
+        username = create_username_from_dueno(dueno)
+        users.append({
+            "email": create_email_from_username(username),
+            "username": username,
+            "password": DEFAULT_PASSWORD,
+            "full_name": dueno,
+            "dueno_de_activo": dueno,
+            "is_active": True,
+            "is_superuser": False,
+        })
+    return users
+
+
+def default_users() -> List[Dict]:
+    """Admin followed by every propietario user"""
+    return [admin_user()] + propietario_users()
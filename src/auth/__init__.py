@@ -1,19 +1,37 @@
-from .dependencies import get_current_user, get_current_active_user, get_current_superuser
+from .dependencies import (
+    get_current_user,
+    get_current_user_profile,
+    get_current_active_user,
+    get_current_superuser,
+    get_introspection_client,
+)
 from .jwt_utils import (
     verify_password,
     get_password_hash,
+    verify_password_async,
+    get_password_hash_async,
+    get_password_hashes,
+    password_needs_rehash,
     create_access_token,
     create_refresh_token,
     verify_token,
+    get_token_subject,
 )
 
 __all__ = [
     "get_current_user",
+    "get_current_user_profile",
     "get_current_active_user", 
     "get_current_superuser",
+    "get_introspection_client",
     "verify_password",
     "get_password_hash",
+    "verify_password_async",
+    "get_password_hash_async",
+    "get_password_hashes",
+    "password_needs_rehash",
     "create_access_token",
     "create_refresh_token",
     "verify_token",
+    "get_token_subject",
 ]
\ No newline at end of file
@@ -0,0 +1,118 @@
+"""
+API keys for service principals.
+
+Keys are random strings shown once at creation. The database stores only an
+HMAC-SHA256 digest (unique index), so verifying a key is one HMAC plus one cached
+lookup instead of a bcrypt check.
+"""
+import hashlib
+import hmac
+import os
+import secrets
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+
+from sqlalchemy import select
+
+from src.auth.jwt_utils import SECRET_KEY
+from src.config.database import LazySession
+from src.models.api_key import ApiKey
+from src.models.user import User
+
+API_KEY_PREFIX = "ak_"
+API_KEY_HMAC_SECRET = os.getenv("API_KEY_HMAC_SECRET", SECRET_KEY).encode()
+# Upper bound for other workers to stop accepting a revoked key
+API_KEY_CACHE_TTL_SECONDS = float(os.getenv("API_KEY_CACHE_TTL_SECONDS", "15"))
+API_KEY_CACHE_MAX_ENTRIES = int(os.getenv("API_KEY_CACHE_MAX_ENTRIES", "10000"))
+
+
+def hash_api_key(key: str) -> str:
+    """
+    Digest stored and looked up for an API key
+    """
+    return hmac.new(API_KEY_HMAC_SECRET, key.encode(), hashlib.sha256).hexdigest()
+
+
+def generate_api_key() -> Tuple[str, str, str]:
+    """
+    Create a new API key; returns (key, display prefix, digest)
+    """
+    key = f"{API_KEY_PREFIX}{secrets.token_urlsafe(32)}"
+    return key, key[:len(API_KEY_PREFIX) + 8], hash_api_key(key)
+
+
+class ApiKeyCache:
+    """
+    LRU cache with TTL mapping key digests to their principal (None for unknown keys)
+    """
+
+    def __init__(self, ttl_seconds: float = API_KEY_CACHE_TTL_SECONDS, max_entries: int = API_KEY_CACHE_MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[Optional[User], float]]" = OrderedDict()
+
+    def get(self, digest: str) -> Tuple[bool, Optional[User]]:
+        """Return (found, principal)"""
+        entry = self._entries.get(digest)
+        if entry is None or entry[1] <= time.monotonic():
+            self.misses += 1
+            return False, None
+        self._entries.move_to_end(digest)
+        self.hits += 1
+        return True, entry[0]
+
+    def set(self, digest: str, principal: Optional[User], expires_at: Optional[datetime] = None) -> None:
+        ttl = self.ttl_seconds
+        if expires_at is not None:
+            # Never keep a key cached past its own expiry
+            ttl = min(ttl, max(0.0, (expires_at - datetime.now(timezone.utc)).total_seconds()))
+        self._entries[digest] = (principal, time.monotonic() + ttl)
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, digest: str) -> None:
+        self._entries.pop(digest, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Process-wide API key cache
+api_key_cache = ApiKeyCache()
+
+
+async def authenticate_api_key(db: LazySession, key: str) -> Optional[User]:
+    """
+    Resolve an API key to its (detached) service principal, or None if invalid
+    """
+    if not key.startswith(API_KEY_PREFIX):
+        return None
+
+    digest = hash_api_key(key)
+    found, principal = api_key_cache.get(digest)
+    if found:
+        return principal
+
+    # Only a cache miss opens a session
+    result = await db.session.execute(select(ApiKey).where(ApiKey.key_digest == digest))
+    api_key = result.scalar_one_or_none()
+
+    principal = None
+    expires_at = None
+    if api_key is not None and api_key.is_active:
+        expires_at = api_key.expires_at
+        if expires_at is not None and expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        if expires_at is None or expires_at > datetime.now(timezone.utc):
+            principal = api_key.user
+
+    api_key_cache.set(digest, principal, expires_at)
+    return principal
@@ -1,58 +1,150 @@
+from dataclasses import replace
 from typing import Optional
 
 from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.security import APIKeyHeader, HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy import select
 
-from src.auth.jwt_utils import verify_token
-from src.config.database import get_db
+from src.auth.api_keys import authenticate_api_key, hash_api_key
+from src.auth.jwt_utils import get_token_subject, verify_token
+from src.auth.user_cache import CachedUserProfile, user_profile_cache
+from src.config.database import LazySession, get_lazy_read_db
+from src.config.server_timing import authorize_server_timing, span
 from src.models.user import User
 from src.schemas.auth import TokenData
 
 # Bearer token security scheme
 security = HTTPBearer()
 
+# Either a bearer token or a service API key is accepted by get_current_user
+optional_security = HTTPBearer(auto_error=False)
+api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
+
+
+def _get_token_user_id(credentials: HTTPAuthorizationCredentials) -> int:
+    """
+    Verify the bearer access token and return its user id
+    """
+    with span("jwt"):
+        payload = verify_token(credentials.credentials, token_type="access")
+    user_id = get_token_subject(payload) if payload is not None else None
+    if user_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user_id
+
 
 async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db)
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+    api_key: Optional[str] = Depends(api_key_header),
+    db: LazySession = Depends(get_lazy_read_db)
 ) -> User:
     """
-    Get current authenticated user from JWT token
+    Get current authenticated user from JWT token or service API key (X-API-Key)
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-
-    # Verify token
-    payload = verify_token(credentials.credentials, token_type="access")
-    if payload is None:
-        raise credentials_exception
+    if api_key:
+        # Service principal: one HMAC + cached lookup, no bcrypt and no JWT
+        with span("user"):
+            user = await authenticate_api_key(db, api_key)
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid API key",
+            )
+    elif credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authenticated"
+        )
+    else:
+        user_id = _get_token_user_id(credentials)
 
-    # Get user info from token
-    user_id: Optional[int] = payload.get("sub")
-    if user_id is None:
-        raise credentials_exception
+        # Get user from database
+        with span("user"):
+            result = await db.session.execute(select(User).where(User.id == user_id))
+            user = result.scalar_one_or_none()
 
-    # Get user from database
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    # Return the connection to the pool before the handler runs
+    await db.release()
     
     if user is None:
-        raise credentials_exception
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
         
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Inactive user"
         )
-    
+
+    authorize_server_timing(user.is_superuser)
     return user
 
 
+async def get_current_user_profile(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+    api_key: Optional[str] = Depends(api_key_header),
+    db: LazySession = Depends(get_lazy_read_db)
+) -> CachedUserProfile:
+    """
+    Get current user's cached profile from a JWT token or service API key (X-API-Key);
+    the database is only queried on a cache miss
+    """
+    principal = None
+    if api_key:
+        with span("user"):
+            principal = await authenticate_api_key(db, api_key)
+        if principal is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid API key",
+            )
+        user_id = principal.id
+    elif credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authenticated"
+        )
+    else:
+        user_id = _get_token_user_id(credentials)
+
+    with span("user"):
+        cached = user_profile_cache.get(user_id)
+        if cached is None and principal is not None:
+            cached = user_profile_cache.set(principal)
+        elif cached is None:
+            result = await db.session.execute(select(User).where(User.id == user_id))
+            user = result.scalar_one_or_none()
+            if user is None:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Could not validate credentials",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+            cached = user_profile_cache.set(user)
+    # Return the connection (API key or user miss) to the pool before the handler runs
+    await db.release()
+
+    if not cached.profile.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Inactive user"
+        )
+
+    authorize_server_timing(cached.profile.is_superuser)
+    if api_key:
+        # Per-key validator: a 304 cached for one key is never revalidated by another credential
+        key_id = hash_api_key(api_key)[:16]
+        cached = replace(cached, etag=f'{cached.etag[:-1]}-{key_id}"')
+    return cached
+
+
 async def get_current_active_user(
     current_user: User = Depends(get_current_user)
 ) -> User:
@@ -81,6 +173,20 @@ async def get_current_superuser(
     return current_user
 
 
+async def get_introspection_client(
+    current_user: User = Depends(get_current_user)
+) -> User:
+    """
+    Get a caller allowed to introspect tokens: a superuser or a can_introspect service principal
+    """
+    if not (current_user.is_superuser or current_user.can_introspect):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
+    return current_user
+
+
 def check_asset_ownership(current_user: User, asset_owner: str) -> bool:
     """
     Check if user can access assets with specific owner
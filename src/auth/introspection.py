@@ -0,0 +1,76 @@
+"""
+Token introspection cache (RFC 7662 style).
+
+Signature/expiry verification results are cached per token until the token expires
+(invalid tokens for a fixed TTL), so repeated introspection of the same token skips
+JWT decoding. Only the signature check is cached: refresh-token revocation is checked
+by the endpoint on every call, and user status is always taken from the user profile
+cache, which is invalidated on user changes, so neither is hidden behind this cache.
+"""
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from src.auth.jwt_utils import verify_token
+
+INTROSPECTION_NEGATIVE_TTL_SECONDS = float(os.getenv("INTROSPECTION_NEGATIVE_TTL_SECONDS", "300"))
+INTROSPECTION_CACHE_MAX_ENTRIES = int(os.getenv("INTROSPECTION_CACHE_MAX_ENTRIES", "50000"))
+
+# Sentinel distinguishing "cached as invalid" from "not cached"
+_INVALID = object()
+
+
+class IntrospectionCache:
+    """
+    LRU cache of verified token claims keyed by a digest of the token
+    """
+
+    def __init__(self, max_entries: int = INTROSPECTION_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[bytes, Tuple[object, float]]" = OrderedDict()
+
+    @staticmethod
+    def _key(token: str, token_type: str) -> bytes:
+        return hashlib.blake2b(f"{token_type}:{token}".encode(), digest_size=20).digest()
+
+    def verify(self, token: str, token_type: str = "access") -> Optional[dict]:
+        """
+        Return the verified claims of a token (None if invalid), using the cache
+        """
+        key = self._key(token, token_type)
+        now = time.monotonic()
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] > now:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return None if entry[0] is _INVALID else entry[0]
+
+        self.misses += 1
+        payload = verify_token(token, token_type=token_type)
+        if payload is None:
+            expires_at = now + INTROSPECTION_NEGATIVE_TTL_SECONDS
+        else:
+            # Convert the absolute exp claim to the monotonic clock
+            expires_at = now + max(0.0, payload["exp"] - time.time())
+
+        self._entries[key] = (_INVALID if payload is None else payload, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+        return payload
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Process-wide introspection cache
+introspection_cache = IntrospectionCache()
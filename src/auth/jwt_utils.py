@@ -1,18 +1,41 @@
+import asyncio
 import os
+import secrets
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import List, Optional
 
 import jwt
 from passlib.context import CryptContext
 
+from src.auth.keys import get_key_set, is_asymmetric
+from src.config.cpus import available_cpus
+
 # Configuration
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-super-secret-jwt-key-here-change-this-in-production")
 ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("JWT_ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("JWT_REFRESH_TOKEN_EXPIRE_DAYS", "7"))
 
+# Password hashing cost (log2 rounds). Tune per host with scripts/calibrate_bcrypt.py
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
 # Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
+
+# bcrypt releases the GIL, so a thread pool hashes in parallel without blocking the event loop.
+# The default splits the CPUs among the server worker processes (WEB_CONCURRENCY)
+_cpus_per_worker = max(1, available_cpus() // max(1, int(os.getenv("WEB_CONCURRENCY", "1"))))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(_cpus_per_worker)))
+password_hash_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt")
+# Bulk hashing holds at most this many pool threads at once, so interactive logins and
+# registrations always find a free thread (or at most one bulk job ahead of them)
+PASSWORD_HASH_BULK_WORKERS = int(
+    os.getenv("PASSWORD_HASH_BULK_WORKERS", str(max(1, PASSWORD_HASH_WORKERS - 1)))
+)
+_bulk_hash_slots = asyncio.Semaphore(PASSWORD_HASH_BULK_WORKERS)
+# Updated only from the event loop thread; queued = in_flight beyond the pool size
+password_hash_pool_stats = {"in_flight": 0, "completed": 0}
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -29,6 +52,94 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def _run_in_hash_pool(func, *args):
+    password_hash_pool_stats["in_flight"] += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(password_hash_executor, func, *args)
+    finally:
+        password_hash_pool_stats["in_flight"] -= 1
+        password_hash_pool_stats["completed"] += 1
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password in the bcrypt thread pool (off the event loop)
+    """
+    return await _run_in_hash_pool(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    Hash a password in the bcrypt thread pool (off the event loop)
+    """
+    return await _run_in_hash_pool(get_password_hash, password)
+
+
+async def _get_password_hash_bulk(password: str) -> str:
+    async with _bulk_hash_slots:
+        return await get_password_hash_async(password)
+
+
+async def get_password_hashes(passwords: List[str]) -> List[str]:
+    """
+    Hash many passwords in parallel using at most PASSWORD_HASH_BULK_WORKERS pool threads
+    """
+    return list(await asyncio.gather(*(_get_password_hash_bulk(password) for password in passwords)))
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check if a stored hash was created with outdated parameters (e.g. other bcrypt rounds)
+    """
+    return pwd_context.needs_update(hashed_password)
+
+
+def _encode_token(to_encode: dict) -> str:
+    """
+    Sign a token with the shared secret (HS*) or the active private key (RS*/EdDSA)
+    """
+    # RFC 7519 requires "sub" to be a string; PyJWT rejects anything else on decode
+    if "sub" in to_encode:
+        to_encode["sub"] = str(to_encode["sub"])
+
+    if is_asymmetric(ALGORITHM):
+        key_set = get_key_set(ALGORITHM)
+        return jwt.encode(
+            to_encode,
+            key_set.private_key,
+            algorithm=ALGORITHM,
+            headers={"kid": key_set.active_kid},
+        )
+    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+
+
+def _verification_key(token: str):
+    """
+    Select the key that should verify a token (by kid for asymmetric algorithms)
+    """
+    if not is_asymmetric(ALGORITHM):
+        return SECRET_KEY
+    kid = jwt.get_unverified_header(token).get("kid")
+    return get_key_set(ALGORITHM).get_public_key(kid)
+
+
+def new_token_id() -> str:
+    """
+    Generate a random identifier for the jti/fid claims
+    """
+    return secrets.token_urlsafe(16)
+
+
+def get_token_subject(payload: dict) -> Optional[int]:
+    """
+    Extract the user id from a verified token payload
+    """
+    try:
+        return int(payload["sub"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     Create JWT access token
@@ -39,14 +150,14 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     else:
         expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     
-    to_encode.update({"exp": expire, "type": "access"})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+    to_encode.update({"exp": expire, "type": "access", "jti": new_token_id()})
+    return _encode_token(to_encode)
 
 
 def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
-    Create JWT refresh token
+    Create JWT refresh token. Rotated tokens keep the family id ("fid") of the
+    token they replace so reuse can revoke the whole family.
     """
     to_encode = data.copy()
     if expires_delta:
@@ -54,9 +165,9 @@ def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None)
     else:
         expire = datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
     
-    to_encode.update({"exp": expire, "type": "refresh"})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+    to_encode.setdefault("fid", new_token_id())
+    to_encode.update({"exp": expire, "type": "refresh", "jti": new_token_id()})
+    return _encode_token(to_encode)
 
 
 def verify_token(token: str, token_type: str = "access") -> Optional[dict]:
@@ -64,7 +175,10 @@ def verify_token(token: str, token_type: str = "access") -> Optional[dict]:
     Verify and decode JWT token
     """
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        key = _verification_key(token)
+        if key is None:
+            return None
+        payload = jwt.decode(token, key, algorithms=[ALGORITHM])
         
         # Check token type
         if payload.get("type") != token_type:
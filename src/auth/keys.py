@@ -0,0 +1,162 @@
+"""
+Asymmetric JWT signing keys and JWKS publication.
+
+Keys are loaded once per process from either:
+- JWT_KEYS_DIR: a directory with one private key per file (<kid>.pem) and,
+  optionally, retired public keys kept for verification only (<kid>.pub.pem).
+  The active signing key is JWT_ACTIVE_KEY_ID, or the newest private key file.
+- JWT_PRIVATE_KEY / JWT_KEY_ID: a single inline PEM private key (useful on Railway).
+
+Rotation: add a new private key, point JWT_ACTIVE_KEY_ID at it, and keep the old
+key (or only its public half) until every token it signed has expired.
+"""
+import os
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed448, ed25519, rsa
+from jwt.algorithms import OKPAlgorithm, RSAAlgorithm
+
+# Algorithms signed with a private key and verifiable through the JWKS endpoint
+ASYMMETRIC_ALGORITHMS = {"RS256", "RS384", "RS512", "EdDSA"}
+
+# Key types each algorithm can sign/verify with (private and public halves)
+ALGORITHM_KEY_TYPES = {
+    "RS256": (rsa.RSAPrivateKey, rsa.RSAPublicKey),
+    "RS384": (rsa.RSAPrivateKey, rsa.RSAPublicKey),
+    "RS512": (rsa.RSAPrivateKey, rsa.RSAPublicKey),
+    "EdDSA": (ed25519.Ed25519PrivateKey, ed25519.Ed25519PublicKey,
+              ed448.Ed448PrivateKey, ed448.Ed448PublicKey),
+}
+
+PRIVATE_KEY_SUFFIX = ".pem"
+PUBLIC_KEY_SUFFIX = ".pub.pem"
+
+
+@dataclass
+class KeySet:
+    """Signing key plus every public key accepted for verification"""
+    algorithm: str
+    active_kid: str
+    private_key: Any
+    public_keys: Dict[str, Any] = field(default_factory=dict)
+
+    def get_public_key(self, kid: Optional[str]) -> Optional[Any]:
+        """Return the verification key for a token's kid header"""
+        if kid is None:
+            return None
+        return self.public_keys.get(kid)
+
+    @cached_property
+    def jwks(self) -> Dict[str, Any]:
+        """JSON Web Key Set with the public half of every known key"""
+        return _build_jwks(self)
+
+
+def is_asymmetric(algorithm: str) -> bool:
+    """Check if the configured JWT algorithm uses public-key signatures"""
+    return algorithm in ASYMMETRIC_ALGORITHMS
+
+
+def _load_private_key(pem: bytes) -> Any:
+    return serialization.load_pem_private_key(pem, password=None)
+
+
+def _load_public_key(pem: bytes) -> Any:
+    return serialization.load_pem_public_key(pem)
+
+
+def _load_from_directory(directory: Path, algorithm: str) -> KeySet:
+    private_keys = {}
+    public_keys = {}
+    newest_kid = None
+    newest_mtime = -1.0
+
+    for path in sorted(directory.iterdir()):
+        if path.name.endswith(PUBLIC_KEY_SUFFIX):
+            kid = path.name[: -len(PUBLIC_KEY_SUFFIX)]
+            public_keys[kid] = _load_public_key(path.read_bytes())
+        elif path.name.endswith(PRIVATE_KEY_SUFFIX):
+            kid = path.name[: -len(PRIVATE_KEY_SUFFIX)]
+            private_keys[kid] = _load_private_key(path.read_bytes())
+            mtime = path.stat().st_mtime
+            if mtime > newest_mtime:
+                newest_kid, newest_mtime = kid, mtime
+
+    if not private_keys:
+        raise RuntimeError(f"No private signing keys (*.pem) found in {directory}")
+
+    active_kid = os.getenv("JWT_ACTIVE_KEY_ID", newest_kid)
+    if active_kid not in private_keys:
+        raise RuntimeError(f"Active JWT key '{active_kid}' not found in {directory}")
+
+    for kid, private_key in private_keys.items():
+        public_keys[kid] = private_key.public_key()
+
+    return KeySet(
+        algorithm=algorithm,
+        active_kid=active_kid,
+        private_key=private_keys[active_kid],
+        public_keys=public_keys,
+    )
+
+
+def _load_inline(pem: str, algorithm: str) -> KeySet:
+    kid = os.getenv("JWT_KEY_ID", "default")
+    private_key = _load_private_key(pem.replace("\\n", "\n").encode())
+    return KeySet(
+        algorithm=algorithm,
+        active_kid=kid,
+        private_key=private_key,
+        public_keys={kid: private_key.public_key()},
+    )
+
+
+def _check_key_types(key_set: KeySet) -> None:
+    """
+    Fail at load time (startup) when a key cannot be used with the algorithm,
+    e.g. an RSA key with EdDSA, instead of on the first signed token
+    """
+    expected = ALGORITHM_KEY_TYPES[key_set.algorithm]
+    keys = [(key_set.active_kid, key_set.private_key), *key_set.public_keys.items()]
+    for kid, key in keys:
+        if not isinstance(key, expected):
+            raise RuntimeError(
+                f"JWT key '{kid}' is {type(key).__name__.lstrip('_')}, which cannot be used with "
+                f"JWT_ALGORITHM={key_set.algorithm}"
+            )
+
+
+@lru_cache(maxsize=1)
+def get_key_set(algorithm: str) -> KeySet:
+    """
+    Load the signing key set for an asymmetric algorithm (cached per process)
+    """
+    keys_dir = os.getenv("JWT_KEYS_DIR")
+    inline_key = os.getenv("JWT_PRIVATE_KEY")
+    if keys_dir:
+        key_set = _load_from_directory(Path(keys_dir), algorithm)
+    elif inline_key:
+        key_set = _load_inline(inline_key, algorithm)
+    else:
+        raise RuntimeError(
+            f"JWT_ALGORITHM={algorithm} requires JWT_KEYS_DIR or JWT_PRIVATE_KEY to be configured"
+        )
+
+    _check_key_types(key_set)
+    return key_set
+
+
+def _build_jwks(key_set: KeySet) -> Dict[str, Any]:
+    keys = []
+    for kid, public_key in key_set.public_keys.items():
+        if key_set.algorithm == "EdDSA":
+            jwk = OKPAlgorithm.to_jwk(public_key, as_dict=True)
+        else:
+            jwk = RSAAlgorithm.to_jwk(public_key, as_dict=True)
+        jwk.update({"kid": kid, "alg": key_set.algorithm, "use": "sig"})
+        keys.append(jwk)
+    return {"keys": keys}
@@ -0,0 +1,207 @@
+"""
+Refresh token revocation.
+
+Every refresh token carries a unique ``jti`` and a ``fid`` (token family, shared by
+all tokens rotated from the same login). Used and revoked identifiers are stored in
+the ``revoked_tokens`` table. An in-memory Bloom filter answers "definitely not
+revoked" without touching the database; only positives fall back to a DB lookup.
+Each worker process has its own filter, so revocations made by other workers are
+pulled in incrementally every ``REVOCATION_SYNC_INTERVAL_SECONDS`` by a background
+task: rows past the newest ``revoked_at`` already seen (minus a small overlap), so a
+sync reads only new revocations and never runs on the request path.
+"""
+import asyncio
+import hashlib
+import math
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config.database import dialect_insert
+from src.models.revoked_token import RevokedToken
+
+REVOCATION_BLOOM_CAPACITY = int(os.getenv("REVOCATION_BLOOM_CAPACITY", "100000"))
+REVOCATION_BLOOM_ERROR_RATE = float(os.getenv("REVOCATION_BLOOM_ERROR_RATE", "0.001"))
+# How often a worker pulls revocations made by other workers
+REVOCATION_SYNC_INTERVAL_SECONDS = float(os.getenv("REVOCATION_SYNC_INTERVAL_SECONDS", "2"))
+# Re-read this much before the high-water mark: revoked_at is stamped at transaction
+# start, so a row can commit after newer ones were already synced
+REVOCATION_SYNC_OVERLAP = timedelta(seconds=5)
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings using double hashing of one blake2b digest
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _hashes(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return h1, h2
+
+    def add(self, item: str) -> None:
+        h1, h2 = self._hashes(item)
+        bits, num_bits = self._bits, self.num_bits
+        for i in range(self.num_hashes):
+            position = (h1 + i * h2) % num_bits
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        h1, h2 = self._hashes(item)
+        bits, num_bits = self._bits, self.num_bits
+        for i in range(self.num_hashes):
+            position = (h1 + i * h2) % num_bits
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._bits)
+
+
+class RefreshTokenRevocationList:
+    """
+    Revocation checks backed by a Bloom filter with DB fallback on positives
+    """
+
+    def __init__(self, capacity: int = REVOCATION_BLOOM_CAPACITY, error_rate: float = REVOCATION_BLOOM_ERROR_RATE):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bloom = BloomFilter(capacity, error_rate)
+        self._needs_rebuild = False
+        # Newest revoked_at seen (None until loaded or while the table is empty)
+        self._high_water: Optional[datetime] = None
+        self._next_sync = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    async def load(self, db: AsyncSession) -> int:
+        """
+        Purge expired rows and rebuild the filter from the remaining revocations
+        """
+        now = datetime.now(timezone.utc)
+        await db.execute(delete(RevokedToken).where(RevokedToken.expires_at <= now))
+        await db.commit()
+
+        active, high_water = (await db.execute(
+            select(func.count(), func.max(RevokedToken.revoked_at))
+        )).one()
+        # Leave headroom so a large backlog does not immediately saturate the new filter
+        bloom = BloomFilter(max(self.capacity, (active or 0) * 2), self.error_rate)
+        result = await db.stream_scalars(select(RevokedToken.jti).where(RevokedToken.expires_at > now))
+        async for jti in result:
+            bloom.add(jti)
+
+        self.bloom = bloom
+        self._needs_rebuild = False
+        self._high_water = high_water
+        self._next_sync = time.monotonic() + REVOCATION_SYNC_INTERVAL_SECONDS
+        return bloom.count
+
+    async def sync(self, db: AsyncSession) -> int:
+        """
+        Add revocations recorded since the last sync (e.g. by other workers)
+        """
+        stmt = select(RevokedToken.jti, RevokedToken.revoked_at)
+        if self._high_water is not None:
+            stmt = stmt.where(RevokedToken.revoked_at >= self._high_water - REVOCATION_SYNC_OVERLAP)
+        result = await db.execute(stmt.execution_options(use_primary=True))
+        added = 0
+        for jti, revoked_at in result:
+            if jti not in self.bloom:
+                self.bloom.add(jti)
+                added += 1
+            if self._high_water is None or revoked_at > self._high_water:
+                self._high_water = revoked_at
+        self._next_sync = time.monotonic() + REVOCATION_SYNC_INTERVAL_SECONDS
+        if self.bloom.count >= self.bloom.capacity:
+            self._needs_rebuild = True
+        return added
+
+    async def is_revoked(self, db: AsyncSession, token_id: str) -> bool:
+        """
+        Check whether a jti or token family has been revoked
+        """
+        # Without the background task (scripts, benchmarks) sync inline instead
+        if self._task is None:
+            if self._needs_rebuild:
+                await self.load(db)
+            elif time.monotonic() >= self._next_sync:
+                await self.sync(db)
+
+        if token_id not in self.bloom:
+            return False
+
+        # Always read from the primary: a lagging replica could miss a fresh revocation
+        result = await db.execute(
+            select(RevokedToken.jti).where(RevokedToken.jti == token_id).execution_options(use_primary=True)
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def revoke(self, db: AsyncSession, token_id: str, user_id: int, expires_at: datetime) -> bool:
+        """
+        Revoke a jti or token family. Returns False if it was already revoked.
+        The caller is responsible for committing the session.
+        """
+        stmt = (
+            dialect_insert(RevokedToken)
+            .values(jti=token_id, user_id=user_id, expires_at=expires_at)
+            .on_conflict_do_nothing(index_elements=[RevokedToken.jti])
+            .returning(RevokedToken.jti)
+        )
+        result = await db.execute(stmt)
+        inserted = result.scalar_one_or_none() is not None
+
+        self.bloom.add(token_id)
+        if self.bloom.count >= self.bloom.capacity:
+            # Saturated filters lose precision; rebuild from unexpired rows on next check
+            self._needs_rebuild = True
+
+        return inserted
+
+    async def _run(self, session_factory: async_sessionmaker) -> None:
+        while True:
+            await asyncio.sleep(REVOCATION_SYNC_INTERVAL_SECONDS)
+            try:
+                async with session_factory() as db:
+                    if self._needs_rebuild:
+                        await self.load(db)
+                    else:
+                        await self.sync(db)
+            except Exception as e:
+                print(f"⚠️  Revocation sync failed: {e}")
+
+    async def start(self, session_factory: async_sessionmaker) -> None:
+        """
+        Sync revocations from other workers in the background (after ``load``)
+        """
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run(session_factory))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# Process-wide revocation list, warmed from the database at startup
+refresh_token_revocations = RefreshTokenRevocationList()
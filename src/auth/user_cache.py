@@ -0,0 +1,81 @@
+"""
+Per-process cache of user profiles (UserResponse projections).
+
+Entries hold the serialized JSON body and its ETag so /auth/me can answer without a
+database round trip. Writes that change a user must call ``invalidate``; the TTL
+bounds staleness for changes made by other workers or directly in the database.
+"""
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from src.models.user import User
+from src.schemas.auth import UserResponse
+
+# Upper bound for other workers to see a deactivation or permission change
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", "15"))
+USER_CACHE_MAX_ENTRIES = int(os.getenv("USER_CACHE_MAX_ENTRIES", "10000"))
+
+
+@dataclass
+class CachedUserProfile:
+    """Cached projection of a user, ready to be sent as a response"""
+    profile: UserResponse
+    body: bytes
+    etag: str
+    expires_at: float
+
+
+class UserProfileCache:
+    """
+    LRU cache with TTL keyed by user id
+    """
+
+    def __init__(self, ttl_seconds: float = USER_CACHE_TTL_SECONDS, max_entries: int = USER_CACHE_MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[int, CachedUserProfile]" = OrderedDict()
+
+    def get(self, user_id: int) -> Optional[CachedUserProfile]:
+        entry = self._entries.get(user_id)
+        if entry is None or entry.expires_at <= time.monotonic():
+            if entry is not None:
+                del self._entries[user_id]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return entry
+
+    def set(self, user: User) -> CachedUserProfile:
+        profile = UserResponse.model_validate(user)
+        body = profile.model_dump_json().encode()
+        entry = CachedUserProfile(
+            profile=profile,
+            body=body,
+            etag=f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"',
+            expires_at=time.monotonic() + self.ttl_seconds,
+        )
+        self._entries[user.id] = entry
+        self._entries.move_to_end(user.id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, user_id: int) -> None:
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Process-wide profile cache
+user_profile_cache = UserProfileCache()
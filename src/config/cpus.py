@@ -0,0 +1,49 @@
+"""
+CPU budget of this process, used to size server workers and the bcrypt thread pool.
+
+Affinity (cpusets) limits which cores a container may run on, but a CFS quota
+(Railway, Docker ``--cpus``, Kubernetes limits) limits how much of them it may use,
+and ``os.sched_getaffinity`` still reports every host core in that case.
+"""
+import math
+import os
+from pathlib import Path
+from typing import Optional
+
+# cgroup v2 exposes "<quota> <period>" (quota "max" when unlimited)
+CGROUP_V2_CPU_MAX = Path("/sys/fs/cgroup/cpu.max")
+# cgroup v1 exposes quota (-1 when unlimited) and period in separate files
+CGROUP_V1_CPU_DIRS = (Path("/sys/fs/cgroup/cpu"), Path("/sys/fs/cgroup/cpu,cpuacct"))
+
+
+def _quota_cpus(quota: int, period: int) -> Optional[int]:
+    if quota <= 0 or period <= 0:
+        return None
+    return max(1, math.ceil(quota / period))
+
+
+def cgroup_cpu_limit() -> Optional[int]:
+    """CPUs allowed by the cgroup CPU quota, or None when there is no quota"""
+    try:
+        quota, period = CGROUP_V2_CPU_MAX.read_text().split()[:2]
+        return None if quota == "max" else _quota_cpus(int(quota), int(period))
+    except (OSError, ValueError):
+        pass
+    for directory in CGROUP_V1_CPU_DIRS:
+        try:
+            quota = int((directory / "cpu.cfs_quota_us").read_text())
+            period = int((directory / "cpu.cfs_period_us").read_text())
+            return _quota_cpus(quota, period)
+        except (OSError, ValueError):
+            continue
+    return None
+
+
+def available_cpus() -> int:
+    """CPUs this process may use: affinity/cpusets, capped by the cgroup CPU quota"""
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0)) or 1
+    else:
+        cpus = os.cpu_count() or 1
+    limit = cgroup_cpu_limit()
+    return min(cpus, limit) if limit is not None else cpus
@@ -0,0 +1,184 @@
+"""
+Memory introspection for administrators.
+
+``tracemalloc`` is off by default because it slows every allocation; it is started
+on demand, a baseline snapshot is kept so later snapshots can be diffed against it,
+and it should be stopped once the investigation is over. ``structure_sizes`` walks
+the gateway's process-local structures (caches, revocation filter, JWKS, readiness
+snapshot, metric series); sizes are approximate (shared objects are counted once
+per structure and ORM internals are skipped).
+"""
+import os
+import sys
+import tracemalloc
+from collections import deque
+from datetime import datetime, timezone
+from types import FunctionType, ModuleType
+from typing import Any, Dict, List, Optional
+
+from src.auth.api_keys import api_key_cache
+from src.auth.introspection import introspection_cache
+from src.auth.revocation import refresh_token_revocations
+from src.auth.user_cache import user_profile_cache
+from src.config import metrics, readiness
+from src.routers import wellknown
+
+# Stack depth recorded per allocation when tracing starts (1 is enough for top-by-file)
+TRACEMALLOC_FRAMES = int(os.getenv("TRACEMALLOC_FRAMES", "1"))
+
+# Allocations made by tracemalloc itself and the import system are noise here
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+_baseline: Optional[tracemalloc.Snapshot] = None
+_baseline_taken_at: Optional[datetime] = None
+
+
+def _take_snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+
+
+def reset_baseline() -> None:
+    global _baseline, _baseline_taken_at
+    _baseline = _take_snapshot()
+    _baseline_taken_at = datetime.now(timezone.utc)
+
+
+def start_tracing(frames: int = TRACEMALLOC_FRAMES) -> None:
+    """Start tracemalloc (if needed) and take the baseline snapshot"""
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+    reset_baseline()
+
+
+def stop_tracing() -> None:
+    """Stop tracemalloc and free its traces and the baseline"""
+    global _baseline, _baseline_taken_at
+    _baseline = None
+    _baseline_taken_at = None
+    tracemalloc.stop()
+
+
+def _location(stat, group_by: str) -> str:
+    frame = stat.traceback[0]
+    return frame.filename if group_by == "filename" else f"{frame.filename}:{frame.lineno}"
+
+
+def tracemalloc_report(top: int, group_by: str = "filename", diff: bool = False) -> Dict[str, Any]:
+    """
+    Current traced memory and the top allocation sites, optionally relative to the baseline
+    """
+    report = {
+        "tracing": tracemalloc.is_tracing(),
+        "frames": tracemalloc.get_traceback_limit(),
+        "traced_current_kb": 0.0,
+        "traced_peak_kb": 0.0,
+        "group_by": group_by,
+        "diff": diff,
+        "baseline_taken_at": _baseline_taken_at,
+        "top": [],
+    }
+    if not report["tracing"]:
+        return report
+
+    current, peak = tracemalloc.get_traced_memory()
+    report["traced_current_kb"] = round(current / 1024, 1)
+    report["traced_peak_kb"] = round(peak / 1024, 1)
+
+    snapshot = _take_snapshot()
+    if diff and _baseline is not None:
+        stats = snapshot.compare_to(_baseline, group_by)[:top]
+        report["top"] = [
+            {
+                "location": _location(stat, group_by),
+                "size_kb": round(stat.size / 1024, 1),
+                "count": stat.count,
+                "size_diff_kb": round(stat.size_diff / 1024, 1),
+                "count_diff": stat.count_diff,
+            }
+            for stat in stats
+        ]
+    else:
+        report["diff"] = False
+        report["top"] = [
+            {"location": _location(stat, group_by), "size_kb": round(stat.size / 1024, 1), "count": stat.count}
+            for stat in snapshot.statistics(group_by)[:top]
+        ]
+    return report
+
+
+def deep_sizeof(obj: Any) -> int:
+    """
+    Approximate bytes retained by ``obj``: containers, instance attributes and leaves.
+    Classes, modules, functions and SQLAlchemy instance state are not followed.
+    """
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, (type, ModuleType, FunctionType)):
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset, deque)):
+            stack.extend(current)
+        elif hasattr(current, "__dict__"):
+            attributes = vars(current)
+            total += sys.getsizeof(attributes)
+            stack.extend(value for name, value in attributes.items() if not name.startswith("_sa_"))
+    return total
+
+
+def structure_sizes() -> List[Dict[str, Any]]:
+    """Entries and approximate size of each process-local structure"""
+    bloom = refresh_token_revocations.bloom
+    metric_series = [metric.values for metric in (
+        metrics.http_request_duration, metrics.http_requests, metrics.http_errors, metrics.upstream_request_duration
+    )]
+    return [
+        {"name": "user_profile_cache", "entries": len(user_profile_cache),
+         "size_bytes": deep_sizeof(user_profile_cache._entries)},
+        {"name": "introspection_cache", "entries": len(introspection_cache),
+         "size_bytes": deep_sizeof(introspection_cache._entries)},
+        {"name": "api_key_cache", "entries": len(api_key_cache),
+         "size_bytes": deep_sizeof(api_key_cache._entries)},
+        {"name": "revocation_bloom_filter", "entries": bloom.count, "size_bytes": bloom.size_bytes},
+        {"name": "jwks_document", "entries": len(wellknown._jwks_cache),
+         "size_bytes": deep_sizeof(wellknown._jwks_cache)},
+        {"name": "readiness_snapshot", "entries": len(readiness.readiness_prober.snapshot or {}),
+         "size_bytes": deep_sizeof(readiness.readiness_prober.snapshot)},
+        {"name": "metric_series", "entries": sum(len(series) for series in metric_series),
+         "size_bytes": deep_sizeof(metric_series)},
+    ]
+
+
+def _proc_status_bytes(field: str) -> Optional[int]:
+    """A kB field of /proc/self/status in bytes (Linux only)"""
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith(f"{field}:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        return None
+    return None
+
+
+# Current and peak come from the same kernel counters so they are always comparable
+def rss_bytes() -> Optional[int]:
+    """Current resident set size (VmRSS)"""
+    return _proc_status_bytes("VmRSS")
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident set size (VmHWM)"""
+    return _proc_status_bytes("VmHWM")
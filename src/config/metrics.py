@@ -0,0 +1,205 @@
+"""
+Prometheus-style metrics collected in-process.
+
+Everything is updated from the event loop thread, so plain dicts and lists are
+enough: no locks and no allocations beyond the first observation of a label set.
+Gauges (DB pool, bcrypt pool, caches) are read only when ``/metrics`` is scraped.
+Each worker process keeps its own values and labels them with ``pid``.
+"""
+import os
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from fastapi import HTTPException, Request, status
+from fastapi.responses import PlainTextResponse
+
+from src.auth.api_keys import api_key_cache
+from src.auth.introspection import introspection_cache
+from src.auth.jwt_utils import PASSWORD_HASH_WORKERS, password_hash_pool_stats
+from src.auth.user_cache import user_profile_cache
+from src.config.database import get_pool_stats
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "false").lower() == "true"
+# Optional bearer token required to scrape /metrics
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelKey = Tuple[str, ...]
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...]):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.values: Dict[LabelKey, float] = {}
+
+    def inc(self, labels: LabelKey, amount: float = 1.0) -> None:
+        self.values[labels] = self.values.get(labels, 0.0) + amount
+
+    def render(self, pid: str) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} counter"
+        for labels, value in self.values.items():
+            yield f"{self.name}{{{_labels(self.label_names, labels, pid)}}} {value}"
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...], buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = buckets
+        # labels -> [per-bucket counts..., +Inf count, sum]
+        self.values: Dict[LabelKey, List[float]] = {}
+
+    def observe(self, labels: LabelKey, value: float) -> None:
+        series = self.values.get(labels)
+        if series is None:
+            series = self.values[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def render(self, pid: str) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} histogram"
+        for labels, series in self.values.items():
+            label_text = _labels(self.label_names, labels, pid)
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                yield f'{self.name}_bucket{{{label_text},le="{bound}"}} {cumulative}'
+            cumulative += series[len(self.buckets)]
+            yield f'{self.name}_bucket{{{label_text},le="+Inf"}} {cumulative}'
+            yield f"{self.name}_sum{{{label_text}}} {series[-1]}"
+            yield f"{self.name}_count{{{label_text}}} {cumulative}"
+
+
+def _labels(names: Tuple[str, ...], values: LabelKey, pid: str) -> str:
+    pairs = [f'{name}="{value}"' for name, value in zip(names, values)]
+    pairs.append(f'pid="{pid}"')
+    return ",".join(pairs)
+
+
+http_request_duration = Histogram(
+    "http_request_duration_seconds", "Request latency by route template", ("method", "route", "status")
+)
+http_requests = Counter("http_requests_total", "Requests by route template", ("method", "route", "status"))
+http_errors = Counter("http_errors_total", "Requests that ended in 5xx or an unhandled exception", ("method", "route"))
+upstream_request_duration = Histogram(
+    "upstream_request_duration_seconds", "Inventory API call latency by operation", ("operation", "outcome")
+)
+
+# Gauges sampled at scrape time: name -> (help, callback returning {labels: value})
+_gauges: Dict[str, Tuple[str, Tuple[str, ...], Callable[[], Dict[LabelKey, float]]]] = {}
+
+
+def register_gauge(name: str, help_text: str, label_names: Tuple[str, ...],
+                   callback: Callable[[], Dict[LabelKey, float]]) -> None:
+    _gauges[name] = (help_text, label_names, callback)
+
+
+def observe_upstream(operation: str, started: float, outcome: str) -> None:
+    """Record an upstream inventory call started at ``started`` (perf_counter)"""
+    if METRICS_ENABLED:
+        upstream_request_duration.observe((operation, outcome), time.perf_counter() - started)
+
+
+def render_metrics() -> str:
+    pid = str(os.getpid())
+    lines: List[str] = []
+    for metric in (http_request_duration, http_requests, http_errors, upstream_request_duration):
+        lines.extend(metric.render(pid))
+    for name, (help_text, label_names, callback) in _gauges.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} gauge")
+        for labels, value in callback().items():
+            lines.append(f"{name}{{{_labels(label_names, labels, pid)}}} {value}")
+    return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware timing each HTTP request by its route template
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        start = time.perf_counter()
+        status_holder = [500]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status_holder[0] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            # Unmatched paths share one label to keep cardinality bounded
+            template = route.path if route is not None else "__unmatched__"
+            status_code = status_holder[0]
+            labels = (scope["method"], template, str(status_code))
+            http_request_duration.observe(labels, time.perf_counter() - start)
+            http_requests.inc(labels)
+            if status_code >= 500:
+                http_errors.inc((scope["method"], template))
+
+
+def _cache_gauges() -> Dict[LabelKey, float]:
+    values = {}
+    for name, cache in (("user_profile", user_profile_cache), ("introspection", introspection_cache),
+                        ("api_key", api_key_cache)):
+        lookups = cache.hits + cache.misses
+        values[(name, "hits")] = cache.hits
+        values[(name, "misses")] = cache.misses
+        values[(name, "entries")] = len(cache)
+        values[(name, "hit_ratio")] = round(cache.hits / lookups, 4) if lookups else 0.0
+    return values
+
+
+def _pool_gauges() -> Dict[LabelKey, float]:
+    values = {}
+    stats = get_pool_stats()
+    for role, role_stats in (("primary", stats), ("replica", stats.get("replica"))):
+        if not role_stats:
+            continue
+        for key in ("size", "checked_in", "checked_out", "overflow", "saturation", "checkout_wait_max_ms"):
+            if role_stats.get(key) is not None:
+                values[(role, key)] = role_stats[key]
+    return values
+
+
+def _hash_pool_gauges() -> Dict[LabelKey, float]:
+    in_flight = password_hash_pool_stats["in_flight"]
+    return {
+        ("workers",): PASSWORD_HASH_WORKERS,
+        ("in_flight",): in_flight,
+        ("queued",): max(0, in_flight - PASSWORD_HASH_WORKERS),
+        ("completed",): password_hash_pool_stats["completed"],
+    }
+
+
+def install_metrics(app) -> None:
+    """
+    Add the timing middleware, the scrape-time gauges and GET /metrics to the app
+    """
+    register_gauge("gateway_cache", "Process-local cache counters and hit ratio", ("cache", "stat"), _cache_gauges)
+    register_gauge("db_pool", "Database connection pool state", ("role", "stat"), _pool_gauges)
+    register_gauge("bcrypt_pool", "Password hashing thread pool (queued = waiting for a thread)", ("stat",),
+                   _hash_pool_gauges)
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics(request: Request):
+        if METRICS_TOKEN and request.headers.get("authorization") != f"Bearer {METRICS_TOKEN}":
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid metrics token")
+        return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,145 @@
+"""
+Explicit schema migrations tracked in the ``schema_version`` table.
+
+Migrations run from ``scripts/migrate.py`` (Railway pre-deploy / Procfile release),
+not on every boot: startup reads the applied version with a single query and skips
+DDL when it is current. Version 1 creates missing tables from the current models,
+so later migrations must be idempotent (``IF NOT EXISTS``) for fresh databases.
+"""
+import os
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List, Optional
+
+from sqlalchemy import func, insert, inspect, select, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+import src.models  # noqa: F401  Register every table on Base.metadata
+from src.config.database import Base, get_engine
+from src.models.schema_version import SchemaVersion
+
+# Apply pending migrations at startup instead of only reporting them (local development)
+DB_AUTO_MIGRATE = os.getenv("DB_AUTO_MIGRATE", "false").lower() == "true"
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    apply: Callable[[AsyncConnection], Awaitable[None]]
+    # Non-transactional migrations run in autocommit (e.g. CREATE INDEX CONCURRENTLY)
+    transactional: bool = True
+
+
+async def _create_tables(conn: AsyncConnection) -> None:
+    await conn.run_sync(Base.metadata.create_all)
+
+
+async def _add_login_indexes(conn: AsyncConnection) -> None:
+    # Existing databases predate the functional indexes; build them without locking writes
+    concurrently = " CONCURRENTLY" if conn.dialect.name == "postgresql" else ""
+    for column in ("username", "email"):
+        await conn.execute(
+            text(f"CREATE INDEX{concurrently} IF NOT EXISTS ix_users_{column}_lower ON users (lower({column}))")
+        )
+
+
+async def _add_revoked_at_index(conn: AsyncConnection) -> None:
+    # Workers sync revocations made by other workers with revoked_at >= :since
+    concurrently = " CONCURRENTLY" if conn.dialect.name == "postgresql" else ""
+    await conn.execute(
+        text(f"CREATE INDEX{concurrently} IF NOT EXISTS ix_revoked_tokens_revoked_at ON revoked_tokens (revoked_at)")
+    )
+
+
+async def _index_is_unique(conn: AsyncConnection, name: str) -> bool:
+    if conn.dialect.name == "postgresql":
+        definition = await conn.scalar(text("SELECT indexdef FROM pg_indexes WHERE indexname = :name"), {"name": name})
+        return bool(definition) and definition.startswith("CREATE UNIQUE INDEX")
+    rows = (await conn.execute(text("PRAGMA index_list(users)"))).mappings()
+    return any(row["name"] == name and row["unique"] for row in rows)
+
+
+async def _make_login_indexes_unique(conn: AsyncConnection) -> None:
+    # Refuse to continue while case-variants exist: logins for them are ambiguous
+    for column in ("username", "email"):
+        duplicates = (await conn.execute(text(
+            f"SELECT lower({column}) FROM users GROUP BY lower({column}) HAVING count(*) > 1 LIMIT 20"
+        ))).scalars().all()
+        if duplicates:
+            raise RuntimeError(
+                f"users.{column} has case-insensitive duplicates {duplicates}; rename or merge them "
+                "and run the migration again"
+            )
+
+    postgres = conn.dialect.name == "postgresql"
+    for column in ("username", "email"):
+        name = f"ix_users_{column}_lower"
+        if await _index_is_unique(conn, name):
+            continue
+        if postgres:
+            # Build the unique index before dropping the old one so lookups stay indexed
+            await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}_unique"))
+            await conn.execute(text(f"CREATE UNIQUE INDEX CONCURRENTLY {name}_unique ON users (lower({column}))"))
+            await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+            await conn.execute(text(f"ALTER INDEX {name}_unique RENAME TO {name}"))
+        else:
+            await conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+            await conn.execute(text(f"CREATE UNIQUE INDEX {name} ON users (lower({column}))"))
+
+
+async def _add_can_introspect_column(conn: AsyncConnection) -> None:
+    # Fresh databases already got the column from version 1
+    columns = await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_columns("users"))
+    if any(column["name"] == "can_introspect" for column in columns):
+        return
+    await conn.execute(text("ALTER TABLE users ADD COLUMN can_introspect BOOLEAN NOT NULL DEFAULT FALSE"))
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "users, revoked_tokens, api_keys and schema_version tables", _create_tables),
+    Migration(2, "lower(username) / lower(email) login indexes", _add_login_indexes, transactional=False),
+    Migration(3, "revoked_tokens.revoked_at index", _add_revoked_at_index, transactional=False),
+    Migration(4, "unique lower(username) / lower(email) indexes", _make_login_indexes_unique, transactional=False),
+    Migration(5, "users.can_introspect service role", _add_can_introspect_column),
+]
+
+# Version this code expects
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+async def get_schema_version(target_engine: Optional[AsyncEngine] = None) -> int:
+    """
+    Applied schema version (0 when the schema_version table does not exist yet)
+    """
+    async with (target_engine or get_engine()).connect() as conn:
+        try:
+            return await conn.scalar(select(func.max(SchemaVersion.version))) or 0
+        except DBAPIError:
+            return 0
+
+
+async def run_migrations(target_engine: Optional[AsyncEngine] = None) -> List[Migration]:
+    """
+    Apply pending migrations in order; returns the ones applied
+    """
+    target_engine = target_engine or get_engine()
+    current = await get_schema_version(target_engine)
+    applied = []
+
+    for migration in MIGRATIONS:
+        if migration.version <= current:
+            continue
+        record = insert(SchemaVersion).values(version=migration.version, description=migration.description)
+        if migration.transactional:
+            async with target_engine.begin() as conn:
+                await migration.apply(conn)
+                await conn.execute(record)
+        else:
+            async with target_engine.connect() as conn:
+                conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+                await migration.apply(conn)
+                await conn.execute(record)
+        applied.append(migration)
+
+    return applied
@@ -0,0 +1,138 @@
+"""
+Sentry setup with environment-driven, per-route sampling.
+
+Nothing from ``sentry_sdk`` is imported unless ``SENTRY_DSN`` is set. Routes in
+``SENTRY_ROUTE_SAMPLE_RATES`` (health checks, owners list) are traced at their own
+low rate. Other requests are traced at ``SENTRY_SLOW_SAMPLE_RATE`` (the head rate,
+decided before duration and outcome are known); among those, slow and failed ones
+are all sent and fast successful ones are thinned in ``before_send_transaction``.
+
+Effective rates with the defaults: 10% of requests carry tracing overhead, 10% of
+slow/failed requests and 5% of fast ones are sent as transactions. Exceptions are
+reported as error events at ``SENTRY_ERROR_SAMPLE_RATE`` whether traced or not.
+"""
+import os
+import random
+from datetime import datetime
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+SENTRY_ENVIRONMENT = os.getenv("SENTRY_ENVIRONMENT", os.getenv("ENVIRONMENT", "production"))
+# Share of error events sent (errors are cheap compared to traces)
+SENTRY_ERROR_SAMPLE_RATE = float(os.getenv("SENTRY_ERROR_SAMPLE_RATE", "1.0"))
+# Default share of requests traced
+SENTRY_TRACES_SAMPLE_RATE = float(os.getenv("SENTRY_TRACES_SAMPLE_RATE", "0.05"))
+# Share of traced requests that are also profiled
+SENTRY_PROFILES_SAMPLE_RATE = float(os.getenv("SENTRY_PROFILES_SAMPLE_RATE", "0.0"))
+# Head rate for unlisted routes (tracing overhead); slow (or failed) requests among them are all sent
+SENTRY_SLOW_SAMPLE_RATE = float(os.getenv("SENTRY_SLOW_SAMPLE_RATE", "0.1"))
+SENTRY_SLOW_TRANSACTION_MS = float(os.getenv("SENTRY_SLOW_TRANSACTION_MS", "1000"))
+
+# Per-route trace rates by path prefix; override with "path=rate,path=rate"
+DEFAULT_ROUTE_SAMPLE_RATES = {
+    "/health": 0.001,
+    "/ready": 0.001,
+    "/inventario/owners": 0.01,
+}
+
+# Trace statuses that count as failures (4xx such as unauthenticated do not)
+ERROR_STATUSES = {"internal_error", "unknown_error", "unknown", "unavailable", "deadline_exceeded", "data_loss"}
+
+
+def parse_route_sample_rates(value: Optional[str]) -> Dict[str, float]:
+    rates = dict(DEFAULT_ROUTE_SAMPLE_RATES)
+    for item in (value or "").split(","):
+        if "=" in item:
+            path, rate = item.split("=", 1)
+            rates[path.strip()] = float(rate)
+    return rates
+
+
+ROUTE_SAMPLE_RATES = parse_route_sample_rates(os.getenv("SENTRY_ROUTE_SAMPLE_RATES"))
+
+
+def _route_override(path: Optional[str]) -> Optional[float]:
+    """Configured rate for a path (longest matching prefix), if any"""
+    best, rate = -1, None
+    for prefix, prefix_rate in ROUTE_SAMPLE_RATES.items():
+        if path and path.startswith(prefix) and len(prefix) > best:
+            best, rate = len(prefix), prefix_rate
+    return rate
+
+
+def head_sample_rate(path: Optional[str]) -> float:
+    """
+    Rate used when a request starts, before its duration and outcome are known.
+    Listed high-volume routes use their own rate; the rest use the slow rate.
+    """
+    override = _route_override(path)
+    if override is not None:
+        return override
+    return max(SENTRY_TRACES_SAMPLE_RATE, SENTRY_SLOW_SAMPLE_RATE)
+
+
+def keep_rate(path: Optional[str]) -> float:
+    """Rate at which fast, successful requests end up sent"""
+    override = _route_override(path)
+    return override if override is not None else SENTRY_TRACES_SAMPLE_RATE
+
+
+def traces_sampler(sampling_context: dict) -> float:
+    parent_sampled = sampling_context.get("parent_sampled")
+    if parent_sampled is not None:
+        # Keep distributed traces consistent with the caller's decision
+        return float(parent_sampled)
+    scope = sampling_context.get("asgi_scope") or {}
+    return head_sample_rate(scope.get("path"))
+
+
+def _duration_ms(event: dict) -> Optional[float]:
+    start, end = event.get("start_timestamp"), event.get("timestamp")
+    if isinstance(start, datetime) and isinstance(end, datetime):
+        return (end - start).total_seconds() * 1000
+    if isinstance(start, (int, float)) and isinstance(end, (int, float)):
+        return (end - start) * 1000
+    return None
+
+
+def before_send_transaction(event: dict, hint: dict) -> Optional[dict]:
+    status = event.get("contexts", {}).get("trace", {}).get("status")
+    duration = _duration_ms(event)
+    if status in ERROR_STATUSES or (duration is not None and duration >= SENTRY_SLOW_TRANSACTION_MS):
+        return event
+
+    # Fast and successful: thin from the head rate down to the route's rate
+    url = (event.get("request") or {}).get("url")
+    path = urlsplit(url).path if url else event.get("transaction")
+    head = head_sample_rate(path)
+    if head <= 0 or random.random() < keep_rate(path) / head:
+        return event
+    return None
+
+
+def init_sentry() -> bool:
+    """
+    Initialize Sentry if SENTRY_DSN is set; returns whether it was enabled
+    """
+    # Read at call time so a DSN from .env (loaded by main) is honoured
+    dsn = os.getenv("SENTRY_DSN")
+    if not dsn:
+        return False
+
+    import sentry_sdk
+    from sentry_sdk.integrations.fastapi import FastApiIntegration
+    from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
+
+    sentry_sdk.init(
+        dsn=dsn,
+        environment=SENTRY_ENVIRONMENT,
+        integrations=[
+            FastApiIntegration(),
+            SqlalchemyIntegration(),
+        ],
+        sample_rate=SENTRY_ERROR_SAMPLE_RATE,
+        traces_sampler=traces_sampler,
+        before_send_transaction=before_send_transaction,
+        profiles_sample_rate=SENTRY_PROFILES_SAMPLE_RATE,
+    )
+    return True
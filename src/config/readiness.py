@@ -0,0 +1,148 @@
+"""
+Readiness probing with cached dependency checks.
+
+A background task checks the database and the upstream inventory API on an
+interval and stores the result. ``/ready`` only reads that snapshot, so probe
+traffic from the orchestrator never triggers a query or an upstream call.
+The read replica (if configured) is probed too, so an outage takes it out of
+rotation before a request runs into it; it does not affect readiness.
+"""
+import asyncio
+import os
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+import httpx
+from sqlalchemy import text
+
+from src.config.database import get_engine, get_read_engine, replica_health
+from src.config.db_status import check_database_available
+from src.routers.inventory import INVENTORY_API_BASE_URL
+
+READINESS_PROBE_INTERVAL_SECONDS = float(os.getenv("READINESS_PROBE_INTERVAL_SECONDS", "10"))
+READINESS_PROBE_TIMEOUT_SECONDS = float(os.getenv("READINESS_PROBE_TIMEOUT_SECONDS", "3"))
+READINESS_UPSTREAM_URL = os.getenv("READINESS_UPSTREAM_URL", f"{INVENTORY_API_BASE_URL}/inventario/?skip=0&limit=1")
+# An upstream outage only degrades inventory routes; by default it does not fail readiness
+READINESS_REQUIRE_UPSTREAM = os.getenv("READINESS_REQUIRE_UPSTREAM", "false").lower() == "true"
+
+
+class ReadinessProber:
+    """
+    Periodically refreshed snapshot of dependency health
+    """
+
+    def __init__(self, interval_seconds: float = READINESS_PROBE_INTERVAL_SECONDS,
+                 timeout_seconds: float = READINESS_PROBE_TIMEOUT_SECONDS):
+        self.interval_seconds = interval_seconds
+        self.timeout_seconds = timeout_seconds
+        self.snapshot: Optional[dict] = None
+        self.updated_at: Optional[float] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def _ping(self, engine) -> None:
+        # The timeout covers pool checkout and connect too, so a saturated pool
+        # cannot stall the prober (and let the snapshot go stale)
+        async def ping():
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        await asyncio.wait_for(ping(), self.timeout_seconds)
+
+    async def _check_database(self) -> dict:
+        if not check_database_available():
+            return {"ok": True, "skipped": True}
+        start = time.perf_counter()
+        try:
+            await self._ping(get_engine())
+            return {"ok": True, "latency_ms": round((time.perf_counter() - start) * 1000, 2)}
+        except Exception as e:
+            return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+    async def _check_replica(self) -> Optional[dict]:
+        read_engine = get_read_engine() if check_database_available() else None
+        if read_engine is None:
+            return None
+        start = time.perf_counter()
+        try:
+            await self._ping(read_engine)
+        except Exception as e:
+            # Connection errors are already recorded by the replica's error hook
+            if replica_health.is_available():
+                replica_health.mark_unhealthy()
+            return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        replica_health.mark_healthy()
+        return {"ok": True, "latency_ms": round((time.perf_counter() - start) * 1000, 2)}
+
+    async def _check_upstream(self) -> dict:
+        start = time.perf_counter()
+        try:
+            response = await self._client.get(READINESS_UPSTREAM_URL)
+            return {
+                "ok": response.status_code < 500,
+                "status_code": response.status_code,
+                "latency_ms": round((time.perf_counter() - start) * 1000, 2),
+            }
+        except httpx.HTTPError as e:
+            return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+    async def probe(self) -> dict:
+        """
+        Run all checks once and store the snapshot
+        """
+        database, replica, upstream = await asyncio.gather(
+            self._check_database(), self._check_replica(), self._check_upstream()
+        )
+        ready = database["ok"] and (upstream["ok"] or not READINESS_REQUIRE_UPSTREAM)
+        checks = {"database": database, "inventory_api": upstream}
+        if replica is not None:
+            checks["database_replica"] = replica
+        self.snapshot = {
+            "ready": ready,
+            "checked_at": datetime.now(timezone.utc).isoformat(),
+            "checks": checks,
+        }
+        self.updated_at = time.monotonic()
+        return self.snapshot
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.probe()
+            except Exception as e:
+                print(f"⚠️  Readiness probe failed: {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._client = httpx.AsyncClient(timeout=self.timeout_seconds)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def age_seconds(self) -> Optional[float]:
+        if self.updated_at is None:
+            return None
+        return time.monotonic() - self.updated_at
+
+    @property
+    def is_stale(self) -> bool:
+        # A snapshot older than a few intervals means the prober itself is stuck
+        age = self.age_seconds
+        return age is None or age > self.interval_seconds * 3 + self.timeout_seconds
+
+
+# Process-wide prober, started in the application lifespan
+readiness_prober = ReadinessProber()
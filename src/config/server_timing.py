@@ -0,0 +1,152 @@
+"""
+Optional ``Server-Timing`` response header with a per-request latency breakdown.
+
+A request opts in with ``X-Server-Timing: 1``. Handlers and dependencies record
+spans (``jwt``, ``user``, ``upstream``, ``filter``, ``serialize``) into a context
+variable; the header is only emitted for superusers unless SERVER_TIMING=all.
+When a request did not opt in, ``span()`` is a context-variable read returning a
+shared no-op, and with SERVER_TIMING=off the middleware is not installed at all.
+"""
+import functools
+import inspect
+import os
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional
+
+from fastapi.routing import APIRoute
+
+# off | admin (opt-in header, superusers only) | all (opt-in header, anyone)
+SERVER_TIMING = os.getenv("SERVER_TIMING", "admin").lower()
+SERVER_TIMING_REQUEST_HEADER = b"x-server-timing"
+
+
+class RequestTimings:
+    """Span durations (ms) collected for one request"""
+
+    def __init__(self):
+        self.spans: Dict[str, float] = {}
+        self.authorized = SERVER_TIMING == "all"
+        self.endpoint_finished: Optional[float] = None
+
+    def add(self, name: str, duration_ms: float) -> None:
+        # Repeated spans (e.g. two upstream calls) are summed
+        self.spans[name] = self.spans.get(name, 0.0) + duration_ms
+
+    def header_value(self, total_ms: float) -> str:
+        parts = [f"{name};dur={duration:.2f}" for name, duration in self.spans.items()]
+        parts.append(f"total;dur={total_ms:.2f}")
+        return ", ".join(parts)
+
+
+_current: ContextVar[Optional[RequestTimings]] = ContextVar("server_timing", default=None)
+
+
+class _Span:
+    __slots__ = ("timings", "name", "start")
+
+    def __init__(self, timings: RequestTimings, name: str):
+        self.timings = timings
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.timings.add(self.name, (time.perf_counter() - self.start) * 1000)
+        return False
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def span(name: str):
+    """Context manager timing a block into the current request's Server-Timing"""
+    timings = _current.get()
+    if timings is None:
+        return _NOOP_SPAN
+    return _Span(timings, name)
+
+
+def authorize_server_timing(is_superuser: bool) -> None:
+    """Called once the caller is authenticated; superusers may see the header"""
+    timings = _current.get()
+    if timings is not None and is_superuser:
+        timings.authorized = True
+
+
+class TimedRoute(APIRoute):
+    """
+    APIRoute that records the time between the endpoint returning and the
+    response being ready (response_model validation and JSON serialization)
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs):
+        if inspect.iscoroutinefunction(endpoint):
+            original = endpoint
+
+            @functools.wraps(original)
+            async def endpoint(*args, **kw):
+                try:
+                    return await original(*args, **kw)
+                finally:
+                    timings = _current.get()
+                    if timings is not None:
+                        timings.endpoint_finished = time.perf_counter()
+
+        super().__init__(path, endpoint, **kwargs)
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def timed_handler(request):
+            response = await handler(request)
+            timings = _current.get()
+            if timings is not None and timings.endpoint_finished is not None:
+                timings.add("serialize", (time.perf_counter() - timings.endpoint_finished) * 1000)
+            return response
+
+        return timed_handler
+
+
+class ServerTimingMiddleware:
+    """
+    Pure ASGI middleware enabling span collection for requests that ask for it
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not any(
+            key == SERVER_TIMING_REQUEST_HEADER and value not in (b"", b"0") for key, value in scope["headers"]
+        ):
+            return await self.app(scope, receive, send)
+
+        timings = RequestTimings()
+        token = _current.set(timings)
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and timings.authorized:
+                total_ms = (time.perf_counter() - start) * 1000
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", timings.header_value(total_ms).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
@@ -1,3 +1,6 @@
 from .user import User
+from .revoked_token import RevokedToken
+from .api_key import ApiKey
+from .schema_version import SchemaVersion
 
-__all__ = ["User"]
\ No newline at end of file
+__all__ = ["User", "RevokedToken", "ApiKey", "SchemaVersion"]
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, Integer, String
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, false
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -22,6 +22,8 @@ class User(Base):
     dueno_de_activo: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     is_superuser: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    # Service role for POST /auth/introspect (sidecars do not need a superuser credential)
+    can_introspect: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false(), nullable=False)
     
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -37,4 +39,10 @@ class User(Base):
     )
 
     def __repr__(self) -> str:
-        return f"<User(id={self.id}, username='{self.username}', email='{self.email}')>"
\ No newline at end of file
+        return f"<User(id={self.id}, username='{self.username}', email='{self.email}')>"
+
+
+# Case-insensitive login lookups: /auth/login matches lower(username) or lower(email).
+# Unique so "Admin" cannot be registered next to "admin" and capture its login
+Index("ix_users_username_lower", func.lower(User.username), unique=True)
+Index("ix_users_email_lower", func.lower(User.email), unique=True)
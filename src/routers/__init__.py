@@ -1,3 +1,3 @@
-from . import auth, inventory
+from . import admin, auth, inventory, wellknown
 
-__all__ = ["auth", "inventory"]
\ No newline at end of file
+__all__ = ["admin", "auth", "inventory", "wellknown"]
\ No newline at end of file
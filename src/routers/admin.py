@@ -0,0 +1,176 @@
+import asyncio
+import cProfile
+import marshal
+import os
+import pstats
+import time
+from datetime import datetime, timezone
+
+import httpx
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+
+from src.auth import get_current_superuser
+from src.config import memory
+from src.models.user import User
+from src.schemas.admin import MemoryReport, ProfileEntry, ProfileRequest, ProfileResponse, TracemallocResponse
+
+router = APIRouter()
+
+# Upper bound for one profiled request
+ADMIN_PROFILE_TIMEOUT_SECONDS = float(os.getenv("ADMIN_PROFILE_TIMEOUT_SECONDS", "30"))
+
+PROFILE_SORT_KEYS = {"cumulative": 3, "tottime": 2, "ncalls": 1}
+
+# cProfile hooks the whole thread, so only one profile may run per worker at a time
+_profile_lock = asyncio.Lock()
+
+
+def _top_entries(stats: dict, sort: str, top: int) -> list:
+    index = PROFILE_SORT_KEYS[sort]
+    rows = sorted(stats.items(), key=lambda item: item[1][index], reverse=True)[:top]
+    return [
+        ProfileEntry(
+            function=function,
+            file=file,
+            line=line,
+            ncalls=ncalls,
+            tottime_ms=round(tottime * 1000, 3),
+            cumtime_ms=round(cumtime * 1000, 3),
+        )
+        for (file, line, function), (_, ncalls, tottime, cumtime, _) in rows
+    ]
+
+
+@router.post("/profile", response_model=ProfileResponse)
+async def profile_request(
+    profile_data: ProfileRequest,
+    request: Request,
+    current_user: User = Depends(get_current_superuser)
+):
+    """
+    Replay one request against this worker under cProfile (superuser only).
+    Returns the top N functions as JSON, or the raw profile for pstats/snakeviz.
+    Other requests served by the worker meanwhile show up in the profile too.
+    """
+    if profile_data.path.startswith("/admin"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Admin endpoints cannot be profiled"
+        )
+    if _profile_lock.locked():
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="A profile is already running on this worker",
+            headers={"Retry-After": "5"},
+        )
+
+    headers = dict(profile_data.headers)
+    if "authorization" not in {name.lower() for name in headers} and request.headers.get("authorization"):
+        headers["Authorization"] = request.headers["authorization"]
+
+    transport = httpx.ASGITransport(app=request.app)
+    async with _profile_lock, httpx.AsyncClient(transport=transport, base_url="http://profile") as client:
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            response = await asyncio.wait_for(
+                client.request(
+                    profile_data.method,
+                    profile_data.path,
+                    params=profile_data.params,
+                    json=profile_data.json_body,
+                    headers=headers,
+                ),
+                ADMIN_PROFILE_TIMEOUT_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            raise HTTPException(
+                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                detail=f"Profiled request exceeded {ADMIN_PROFILE_TIMEOUT_SECONDS}s"
+            )
+        finally:
+            profiler.disable()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+    if profile_data.format == "pstats":
+        profiler.create_stats()
+        filename = f"profile-{datetime.now(timezone.utc):%Y%m%dT%H%M%S}.pstats"
+        return Response(
+            content=marshal.dumps(profiler.stats),
+            media_type="application/octet-stream",
+            headers={
+                "Content-Disposition": f'attachment; filename="{filename}"',
+                "X-Profiled-Status": str(response.status_code),
+            },
+        )
+
+    # Stats() takes ownership of (and clears) profiler.stats
+    stats = pstats.Stats(profiler)
+    return ProfileResponse(
+        method=profile_data.method,
+        path=profile_data.path,
+        status_code=response.status_code,
+        elapsed_ms=round(elapsed_ms, 3),
+        total_calls=stats.total_calls,
+        sort=profile_data.sort,
+        top=_top_entries(stats.stats, profile_data.sort, profile_data.top),
+    )
+
+
+@router.get("/memory", response_model=MemoryReport)
+async def memory_report(current_user: User = Depends(get_current_superuser)):
+    """
+    RSS of this worker and the approximate size of its in-process structures (superuser only)
+    """
+    return MemoryReport(
+        pid=os.getpid(),
+        rss_bytes=memory.rss_bytes(),
+        peak_rss_bytes=memory.peak_rss_bytes(),
+        tracing=memory.tracemalloc.is_tracing(),
+        structures=memory.structure_sizes(),
+    )
+
+
+@router.post("/memory/tracemalloc/start", response_model=TracemallocResponse)
+async def start_tracemalloc(
+    frames: int = Query(memory.TRACEMALLOC_FRAMES, ge=1, le=50),
+    current_user: User = Depends(get_current_superuser)
+):
+    """
+    Start tracing allocations in this worker and take the baseline snapshot.
+    Tracing slows every allocation; stop it when done.
+    """
+    memory.start_tracing(frames)
+    return memory.tracemalloc_report(top=0)
+
+
+@router.post("/memory/tracemalloc/stop", response_model=TracemallocResponse)
+async def stop_tracemalloc(current_user: User = Depends(get_current_superuser)):
+    """
+    Stop tracing and release the traces
+    """
+    memory.stop_tracing()
+    return memory.tracemalloc_report(top=0)
+
+
+@router.get("/memory/tracemalloc", response_model=TracemallocResponse)
+async def tracemalloc_snapshot(
+    top: int = Query(20, ge=1, le=200),
+    group_by: str = Query("filename", pattern="^(filename|lineno|traceback)$"),
+    diff: bool = Query(False, description="Compare against the baseline snapshot"),
+    reset_baseline: bool = Query(False, description="Replace the baseline after this snapshot"),
+    current_user: User = Depends(get_current_superuser)
+):
+    """
+    Top allocation sites in this worker, grouped by file (default), line or traceback
+    """
+    if not memory.tracemalloc.is_tracing():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="tracemalloc is not running; POST /admin/memory/tracemalloc/start first"
+        )
+    report = memory.tracemalloc_report(top=top, group_by=group_by, diff=diff)
+    if reset_baseline:
+        memory.reset_baseline()
+    return report
@@ -1,27 +1,68 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, select, update
 
 from src.auth import (
-    get_password_hash,
-    verify_password,
+    get_password_hash_async,
+    get_password_hashes,
+    verify_password_async,
+    password_needs_rehash,
     create_access_token,
     create_refresh_token,
     verify_token,
-    get_current_user
+    get_token_subject,
+    get_current_user_profile,
+    get_current_superuser,
+    get_introspection_client,
 )
-from src.config.database import get_db
+from src.auth.jwt_utils import REFRESH_TOKEN_EXPIRE_DAYS
+from src.auth.api_keys import api_key_cache, generate_api_key
+from src.auth.introspection import introspection_cache
+from src.auth.revocation import refresh_token_revocations
+from src.auth.user_cache import CachedUserProfile, user_profile_cache
+from src.config.database import LazySession, dialect_insert, get_db, get_lazy_db, get_lazy_read_db
 from src.config.db_status import check_database_available, require_database
+from src.config.server_timing import TimedRoute
+from src.models.api_key import ApiKey
 from src.models.user import User
-from src.schemas.auth import UserCreate, UserResponse, UserLogin, Token
+from src.schemas.auth import (
+    ApiKeyCreate,
+    ApiKeyCreated,
+    ApiKeyResponse,
+    UserBulkCreate,
+    UserBulkResponse,
+    UserBulkResult,
+    UserCreate,
+    UserResponse,
+    UserLogin,
+    Token,
+    TokenIntrospection,
+    TokenIntrospectionRequest,
+    TokenIntrospectionResponse,
+)
+
+router = APIRouter(route_class=TimedRoute)
 
-router = APIRouter()
+REFRESH_TOKEN_REUSE_MSG = "Refresh token reuse detected, please log in again"
+
+
+def login_key_clause(login: str):
+    """
+    Build a case-insensitive lookup on the column implied by the login format.
+    Inputs containing "@" are treated as emails, anything else as a username.
+    """
+    login_key = login.strip().lower()
+    column = User.email if "@" in login_key else User.username
+    return func.lower(column) == login_key
 
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register_user(
     user_data: UserCreate,
-    db: AsyncSession = Depends(get_db)
+    db: LazySession = Depends(get_lazy_db)
 ):
     """
     Register a new user
@@ -29,43 +70,110 @@ async def register_user(
     # Check database availability
     require_database()
     
-    # Check if user already exists
-    result = await db.execute(
-        select(User).where(
-            (User.email == user_data.email) | (User.username == user_data.username)
+    # Insert in one round trip; unique violations (email or username) insert nothing
+    hashed_password = await get_password_hash_async(user_data.password)
+    stmt = (
+        dialect_insert(User)
+        .values(
+            email=user_data.email,
+            username=user_data.username,
+            hashed_password=hashed_password,
+            full_name=user_data.full_name,
+            dueno_de_activo=user_data.dueno_de_activo,
+            is_active=user_data.is_active,
+            is_superuser=user_data.is_superuser,
         )
+        .on_conflict_do_nothing()
+        .returning(User)
     )
-    existing_user = result.scalar_one_or_none()
+    result = await db.session.execute(stmt)
+    db_user = result.scalar_one_or_none()
+    await db.session.commit()
+    await db.release()
     
-    if existing_user:
+    if db_user is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email or username already registered"
         )
     
-    # Create new user
-    hashed_password = get_password_hash(user_data.password)
-    db_user = User(
-        email=user_data.email,
-        username=user_data.username,
-        hashed_password=hashed_password,
-        full_name=user_data.full_name,
-        dueno_de_activo=user_data.dueno_de_activo,
-        is_active=user_data.is_active,
-        is_superuser=user_data.is_superuser,
+    return db_user
+
+
+@router.post("/register/bulk", response_model=UserBulkResponse)
+async def register_users_bulk(
+    bulk_data: UserBulkCreate,
+    db: LazySession = Depends(get_lazy_db),
+    current_user: User = Depends(get_current_superuser)
+):
+    """
+    Register many users at once (admin only).
+    Passwords are hashed in parallel off the event loop and all rows are inserted
+    with a single multi-row statement; existing users (including case-variants of an
+    existing username or email) are reported as "exists", not updated.
+    """
+    # Check database availability
+    require_database()
+    
+    # Case-variants inside the batch would collide on the lower() unique indexes
+    for field in ("username", "email"):
+        seen = set()
+        duplicates = []
+        for user in bulk_data.users:
+            key = getattr(user, field).lower()
+            if key in seen:
+                duplicates.append(getattr(user, field))
+            seen.add(key)
+        if duplicates:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Duplicate {field}s in request (case-insensitive): {', '.join(duplicates[:20])}"
+            )
+    
+    hashed_passwords = await get_password_hashes([user.password for user in bulk_data.users])
+    rows = [
+        {
+            "email": user.email,
+            "username": user.username,
+            "hashed_password": hashed_password,
+            "full_name": user.full_name,
+            "dueno_de_activo": user.dueno_de_activo,
+            "is_active": user.is_active,
+            "is_superuser": user.is_superuser,
+            "can_introspect": user.can_introspect,
+        }
+        for user, hashed_password in zip(bulk_data.users, hashed_passwords)
+    ]
+    
+    stmt = (
+        dialect_insert(User)
+        .values(rows)
+        .on_conflict_do_nothing()
+        .returning(User.id, User.username, User.email)
     )
+    result = await db.session.execute(stmt)
+    inserted = {(row.username, row.email): row.id for row in result}
+    await db.session.commit()
+    await db.release()
     
-    db.add(db_user)
-    await db.commit()
-    await db.refresh(db_user)
+    results = []
+    for user in bulk_data.users:
+        user_id = inserted.pop((user.username, user.email), None)
+        results.append(UserBulkResult(
+            username=user.username,
+            email=user.email,
+            status="created" if user_id is not None else "exists",
+            id=user_id,
+        ))
     
-    return db_user
+    created = sum(1 for item in results if item.status == "created")
+    return UserBulkResponse(created=created, existing=len(results) - created, results=results)
 
 
 @router.post("/login", response_model=Token)
 async def login_user(
     user_credentials: UserLogin,
-    db: AsyncSession = Depends(get_db)
+    db: LazySession = Depends(get_lazy_read_db)
 ):
     """
     Login user and return access and refresh tokens
@@ -73,17 +181,17 @@ async def login_user(
     # Check database availability
     require_database()
     
-    # Find user by username or email
-    result = await db.execute(
-        select(User).where(
-            (User.username == user_credentials.username) | 
-            (User.email == user_credentials.username)
-        )
+    # Find user by username or email with a single index seek on the matching column
+    result = await db.session.execute(
+        select(User).where(login_key_clause(user_credentials.username)).limit(1)
     )
     user = result.scalar_one_or_none()
     
+    # Return the connection to the pool before the (slow) bcrypt verification
+    await db.release()
+    
     # Verify user exists and password is correct
-    if not user or not verify_password(user_credentials.password, user.hashed_password):
+    if not user or not await verify_password_async(user_credentials.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -97,6 +205,16 @@ async def login_user(
             detail="Inactive user"
         )
     
+    # Transparently upgrade hashes stored with outdated bcrypt parameters
+    if password_needs_rehash(user.hashed_password):
+        new_hash = await get_password_hash_async(user_credentials.password)
+        await db.session.execute(
+            update(User).where(User.id == user.id).values(hashed_password=new_hash)
+        )
+        await db.session.commit()
+        await db.release()
+        user_profile_cache.invalidate(user.id)
+    
     # Create tokens
     access_token = create_access_token(data={"sub": user.id, "username": user.username})
     refresh_token = create_refresh_token(data={"sub": user.id, "username": user.username})
@@ -111,23 +229,43 @@ async def login_user(
 @router.post("/refresh", response_model=Token)
 async def refresh_token(
     refresh_token: str,
-    db: AsyncSession = Depends(get_db)
+    db: LazySession = Depends(get_lazy_read_db)
 ):
     """
-    Refresh access token using refresh token
+    Rotate refresh token: the presented token is revoked and a new pair is issued.
+    Presenting an already used token revokes its whole family.
     """
+    invalid_token_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid refresh token",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    
     # Verify refresh token
     payload = verify_token(refresh_token, token_type="refresh")
     if payload is None:
+        raise invalid_token_exception
+    
+    user_id = get_token_subject(payload)
+    jti = payload.get("jti")
+    fid = payload.get("fid")
+    if user_id is None or not jti or not fid:
+        raise invalid_token_exception
+    
+    # Reject revoked tokens (Bloom filter first, DB only on positives)
+    session = db.session
+    if await refresh_token_revocations.is_revoked(session, fid):
+        raise invalid_token_exception
+    if await refresh_token_revocations.is_revoked(session, jti):
+        await _revoke_token_family(session, fid, user_id)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid refresh token",
+            detail=REFRESH_TOKEN_REUSE_MSG,
             headers={"WWW-Authenticate": "Bearer"},
         )
     
     # Get user from database
-    user_id = payload.get("sub")
-    result = await db.execute(select(User).where(User.id == user_id))
+    result = await session.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
     
     if user is None or not user.is_active:
@@ -137,9 +275,21 @@ async def refresh_token(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    # Mark the presented token as used; losing a concurrent race means reuse
+    expires_at = datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
+    if not await refresh_token_revocations.revoke(session, jti, user.id, expires_at):
+        await _revoke_token_family(session, fid, user.id)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=REFRESH_TOKEN_REUSE_MSG,
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    await session.commit()
+    await db.release()
+    
     # Create new tokens
     new_access_token = create_access_token(data={"sub": user.id, "username": user.username})
-    new_refresh_token = create_refresh_token(data={"sub": user.id, "username": user.username})
+    new_refresh_token = create_refresh_token(data={"sub": user.id, "username": user.username, "fid": fid})
     
     return {
         "access_token": new_access_token,
@@ -148,11 +298,169 @@ async def refresh_token(
     }
 
 
+async def _is_refresh_token_revoked(session: AsyncSession, payload: dict) -> bool:
+    jti = payload.get("jti")
+    fid = payload.get("fid")
+    if not jti or not fid:
+        return True
+    return (
+        await refresh_token_revocations.is_revoked(session, fid)
+        or await refresh_token_revocations.is_revoked(session, jti)
+    )
+
+
+@router.post("/introspect", response_model=TokenIntrospectionResponse, response_model_exclude_none=True)
+async def introspect_tokens(
+    introspection_request: TokenIntrospectionRequest,
+    db: LazySession = Depends(get_lazy_read_db),
+    current_user: User = Depends(get_introspection_client)
+):
+    """
+    Introspect a batch of tokens (RFC 7662 style) for services behind the gateway
+    (superusers or users with can_introspect).
+    Signature verification is cached until each token expires; refresh tokens are
+    checked against the revocation list on every call, user status comes from
+    the user profile cache and unknown users are loaded with a single query.
+    """
+    token_type = "refresh" if introspection_request.token_type_hint == "refresh_token" else "access"
+    payloads = [introspection_cache.verify(token, token_type) for token in introspection_request.tokens]
+    
+    # Rotated or reused refresh tokens stay signature-valid: check jti and family (Bloom filter first)
+    if token_type == "refresh":
+        for index, payload in enumerate(payloads):
+            if payload is not None and await _is_refresh_token_revoked(db.session, payload):
+                payloads[index] = None
+    
+    # Resolve every referenced user, hitting the database once for all cache misses
+    user_ids = {get_token_subject(payload) for payload in payloads if payload is not None}
+    user_ids.discard(None)
+    profiles = {user_id: user_profile_cache.get(user_id) for user_id in user_ids}
+    missing = [user_id for user_id, profile in profiles.items() if profile is None]
+    if missing:
+        result = await db.session.execute(select(User).where(User.id.in_(missing)))
+        for user in result.scalars():
+            profiles[user.id] = user_profile_cache.set(user)
+    await db.release()
+    
+    results = []
+    for payload in payloads:
+        cached_profile = profiles.get(get_token_subject(payload)) if payload is not None else None
+        if cached_profile is None or not cached_profile.profile.is_active:
+            results.append(TokenIntrospection(active=False))
+            continue
+        profile = cached_profile.profile
+        results.append(TokenIntrospection(
+            active=True,
+            sub=payload["sub"],
+            username=profile.username,
+            token_type=payload.get("type"),
+            exp=payload.get("exp"),
+            jti=payload.get("jti"),
+            is_superuser=profile.is_superuser,
+            dueno_de_activo=profile.dueno_de_activo,
+        ))
+    
+    return TokenIntrospectionResponse(results=results)
+
+
+@router.post("/api-keys", response_model=ApiKeyCreated, status_code=status.HTTP_201_CREATED)
+async def create_api_key(
+    api_key_data: ApiKeyCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_superuser)
+):
+    """
+    Create an API key for a service principal (admin only).
+    The key carries the permissions of its user and is only shown in this response.
+    """
+    require_database()
+    
+    result = await db.execute(select(User.id).where(User.id == api_key_data.user_id))
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+    
+    key, key_prefix, key_digest = generate_api_key()
+    expires_at = None
+    if api_key_data.expires_in_days:
+        expires_at = datetime.now(timezone.utc) + timedelta(days=api_key_data.expires_in_days)
+    
+    api_key = ApiKey(
+        name=api_key_data.name,
+        key_prefix=key_prefix,
+        key_digest=key_digest,
+        user_id=api_key_data.user_id,
+        is_active=True,
+        expires_at=expires_at,
+    )
+    db.add(api_key)
+    await db.commit()
+    await db.refresh(api_key)
+    
+    return ApiKeyCreated(**ApiKeyResponse.model_validate(api_key).model_dump(), key=key)
+
+
+@router.get("/api-keys", response_model=List[ApiKeyResponse])
+async def list_api_keys(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_superuser)
+):
+    """
+    List API keys (admin only)
+    """
+    require_database()
+    
+    result = await db.execute(select(ApiKey).order_by(ApiKey.id))
+    return result.scalars().all()
+
+
+@router.delete("/api-keys/{api_key_id}", response_model=ApiKeyResponse)
+async def revoke_api_key(
+    api_key_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_superuser)
+):
+    """
+    Revoke an API key (admin only). Other workers drop it when their cache entry expires.
+    """
+    require_database()
+    
+    api_key = await db.get(ApiKey, api_key_id)
+    if api_key is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="API key not found"
+        )
+    
+    api_key.is_active = False
+    await db.commit()
+    api_key_cache.invalidate(api_key.key_digest)
+    
+    return api_key
+
+
+async def _revoke_token_family(db: AsyncSession, fid: str, user_id: int) -> None:
+    """
+    Revoke every refresh token rotated from the same login
+    """
+    expires_at = datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+    await refresh_token_revocations.revoke(db, fid, user_id, expires_at)
+    await db.commit()
+
+
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
-    current_user: User = Depends(get_current_user)
+    request: Request,
+    cached_profile: CachedUserProfile = Depends(get_current_user_profile)
 ):
     """
-    Get current user information
+    Get current user information (served from the profile cache, supports If-None-Match)
     """
-    return current_user
\ No newline at end of file
+    headers = {"ETag": cached_profile.etag, "Cache-Control": "private, no-cache"}
+    
+    if request.headers.get("if-none-match") == cached_profile.etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    return Response(content=cached_profile.body, media_type="application/json", headers=headers)
@@ -1,4 +1,5 @@
 import os
+import time
 from typing import List
 
 import httpx
@@ -6,6 +7,8 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from src.auth import get_current_active_user
 from src.auth.dependencies import check_asset_ownership
+from src.config.metrics import observe_upstream
+from src.config.server_timing import TimedRoute, span
 from src.models.user import User
 from src.schemas.inventory import (
     InventarioActivoCreate,
@@ -14,7 +17,7 @@ from src.schemas.inventory import (
     InventarioActivoOwner,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 # External API configuration
 INVENTORY_API_BASE_URL = os.getenv("INVENTORY_API_BASE_URL", "https://inventoryapp.usbtopia.usbbog.edu.co")
@@ -27,6 +30,21 @@ VALIDATION_ERROR_MSG = "Validation error"
 DUENO_DE_ACTIVO_FIELD = "DUEÑO_DE_ACTIVO"
 
 
+async def _upstream(client: httpx.AsyncClient, operation: str, method: str, url: str, **kwargs) -> httpx.Response:
+    """
+    Call the inventory API, recording latency per operation
+    """
+    start = time.perf_counter()
+    outcome = "error"
+    try:
+        with span("upstream"):
+            response = await client.request(method, url, **kwargs)
+        outcome = str(response.status_code)
+        return response
+    finally:
+        observe_upstream(operation, start, outcome)
+
+
 @router.get("/", response_model=List[InventarioActivoOut])
 async def get_inventario_activos(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
@@ -39,8 +57,8 @@ async def get_inventario_activos(
     """
     async with httpx.AsyncClient() as client:
         try:
-            response = await client.get(
-                f"{INVENTORY_API_BASE_URL}/inventario/",
+            response = await _upstream(
+                client, "list", "GET", f"{INVENTORY_API_BASE_URL}/inventario/",
                 params={"skip": 0, "limit": 2000},  # Get more data to filter
                 timeout=30.0
             )
@@ -48,23 +66,24 @@ async def get_inventario_activos(
             
             all_assets = response.json()
             
-            # Filter assets based on user permissions
-            if current_user.is_superuser:
-                # Admin can see all assets
-                filtered_assets = all_assets
-            else:
-                # Regular users can only see their own assets
-                if not current_user.dueno_de_activo:
-                    return []  # User has no assigned assets
+            with span("filter"):
+                # Filter assets based on user permissions
+                if current_user.is_superuser:
+                    # Admin can see all assets
+                    filtered_assets = all_assets
+                else:
+                    # Regular users can only see their own assets
+                    if not current_user.dueno_de_activo:
+                        return []  # User has no assigned assets
+                    
+                    user_owner = current_user.dueno_de_activo.strip()
+                    filtered_assets = [
+                        asset for asset in all_assets
+                        if asset.get(DUENO_DE_ACTIVO_FIELD, "").strip() == user_owner
+                    ]
                 
-                user_owner = current_user.dueno_de_activo.strip()
-                filtered_assets = [
-                    asset for asset in all_assets
-                    if asset.get(DUENO_DE_ACTIVO_FIELD, "").strip() == user_owner
-                ]
-            
-            # Apply pagination to filtered results
-            paginated_assets = filtered_assets[skip:skip + limit]
+                # Apply pagination to filtered results
+                paginated_assets = filtered_assets[skip:skip + limit]
             
             return paginated_assets
             
@@ -91,8 +110,8 @@ async def get_inventario_owners(
     """
     async with httpx.AsyncClient() as client:
         try:
-            response = await client.get(
-                f"{INVENTORY_API_BASE_URL}/inventario/",
+            response = await _upstream(
+                client, "owners", "GET", f"{INVENTORY_API_BASE_URL}/inventario/",
                 params={"skip": 0, "limit": 1000},  # Get more data to ensure uniqueness
                 timeout=30.0
             )
@@ -101,24 +120,25 @@ async def get_inventario_owners(
             # Get full data from external API
             full_data = response.json()
             
-            # Track unique owners with their first occurrence
-            seen_owners = {}
-            unique_owners = []
-            
-            for item in full_data:
-                if item.get("id") is not None:
-                    owner = item.get(DUENO_DE_ACTIVO_FIELD)
-                    
-                    # Only add if we haven't seen this owner before
-                    if owner not in seen_owners:
-                        seen_owners[owner] = True
-                        unique_owners.append({
-                            "id": item.get("id"),
-                            DUENO_DE_ACTIVO_FIELD: owner
-                        })
-            
-            # Apply pagination to unique results
-            paginated_owners = unique_owners[skip:skip + limit]
+            with span("filter"):
+                # Track unique owners with their first occurrence
+                seen_owners = {}
+                unique_owners = []
+                
+                for item in full_data:
+                    if item.get("id") is not None:
+                        owner = item.get(DUENO_DE_ACTIVO_FIELD)
+                        
+                        # Only add if we haven't seen this owner before
+                        if owner not in seen_owners:
+                            seen_owners[owner] = True
+                            unique_owners.append({
+                                "id": item.get("id"),
+                                DUENO_DE_ACTIVO_FIELD: owner
+                            })
+                
+                # Apply pagination to unique results
+                paginated_owners = unique_owners[skip:skip + limit]
             
             return paginated_owners
         except httpx.HTTPError as e:
@@ -165,8 +185,8 @@ async def create_inventario_activo(
     
     async with httpx.AsyncClient() as client:
         try:
-            response = await client.post(
-                f"{INVENTORY_API_BASE_URL}/inventario/",
+            response = await _upstream(
+                client, "create", "POST", f"{INVENTORY_API_BASE_URL}/inventario/",
                 json=activo_dict,
                 timeout=30.0
             )
@@ -200,8 +220,8 @@ async def get_inventario_activo(
     """
     async with httpx.AsyncClient() as client:
         try:
-            response = await client.get(
-                f"{INVENTORY_API_BASE_URL}/inventario/{activo_id}",
+            response = await _upstream(
+                client, "get", "GET", f"{INVENTORY_API_BASE_URL}/inventario/{activo_id}",
                 timeout=30.0
             )
             response.raise_for_status()
@@ -248,8 +268,8 @@ async def update_inventario_activo(
     async with httpx.AsyncClient() as client:
         try:
             # First, get the current asset to check ownership
-            get_response = await client.get(
-                f"{INVENTORY_API_BASE_URL}/inventario/{activo_id}",
+            get_response = await _upstream(
+                client, "get", "GET", f"{INVENTORY_API_BASE_URL}/inventario/{activo_id}",
                 timeout=30.0
             )
             get_response.raise_for_status()
@@ -273,8 +293,8 @@ async def update_inventario_activo(
                 )
             
             # Perform the update
-            response = await client.put(
-                f"{INVENTORY_API_BASE_URL}/inventario/{activo_id}",
+            response = await _upstream(
+                client, "update", "PUT", f"{INVENTORY_API_BASE_URL}/inventario/{activo_id}",
                 json=update_data,
                 timeout=30.0
             )
@@ -315,8 +335,8 @@ async def delete_inventario_activo(
     async with httpx.AsyncClient() as client:
         try:
             # First, get the current asset to check ownership
-            get_response = await client.get(
-                f"{INVENTORY_API_BASE_URL}/inventario/{activo_id}",
+            get_response = await _upstream(
+                client, "get", "GET", f"{INVENTORY_API_BASE_URL}/inventario/{activo_id}",
                 timeout=30.0
             )
             get_response.raise_for_status()
@@ -331,8 +351,8 @@ async def delete_inventario_activo(
                 )
             
             # Perform the deletion
-            response = await client.delete(
-                f"{INVENTORY_API_BASE_URL}/inventario/{activo_id}",
+            response = await _upstream(
+                client, "delete", "DELETE", f"{INVENTORY_API_BASE_URL}/inventario/{activo_id}",
                 timeout=30.0
             )
             response.raise_for_status()
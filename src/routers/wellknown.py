@@ -0,0 +1,48 @@
+import hashlib
+import json
+import os
+
+from fastapi import APIRouter, HTTPException, Request, Response, status
+
+from src.auth.jwt_utils import ALGORITHM
+from src.auth.keys import get_key_set, is_asymmetric
+
+router = APIRouter()
+
+# How long downstream services may cache the key set before refetching
+JWKS_CACHE_MAX_AGE = int(os.getenv("JWKS_CACHE_MAX_AGE_SECONDS", "3600"))
+
+# Serialized JWKS document and its ETag, built once per process
+_jwks_cache = {}
+
+
+def get_jwks_document() -> tuple:
+    """Serialized JWKS and its ETag (built on first use, or warmed at startup)"""
+    if "body" not in _jwks_cache:
+        body = json.dumps(get_key_set(ALGORITHM).jwks, separators=(",", ":")).encode()
+        _jwks_cache["body"] = body
+        _jwks_cache["etag"] = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    return _jwks_cache["body"], _jwks_cache["etag"]
+
+
+@router.get("/jwks.json")
+async def get_jwks(request: Request):
+    """
+    Public signing keys (JWKS) so other services can verify tokens offline
+    """
+    if not is_asymmetric(ALGORITHM):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"JWKS not available for symmetric algorithm {ALGORITHM}"
+        )
+
+    body, etag = get_jwks_document()
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={JWKS_CACHE_MAX_AGE}",
+    }
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -1,15 +1,58 @@
-from .auth import UserBase, UserCreate, UserUpdate, UserResponse, UserLogin, Token, TokenData
+from .auth import (
+    UserBase,
+    UserCreate,
+    UserBulkCreate,
+    UserBulkResult,
+    UserBulkResponse,
+    UserUpdate,
+    UserResponse,
+    UserLogin,
+    Token,
+    TokenData,
+    TokenIntrospectionRequest,
+    TokenIntrospection,
+    TokenIntrospectionResponse,
+    ApiKeyCreate,
+    ApiKeyResponse,
+    ApiKeyCreated,
+)
+from .admin import (
+    ProfileRequest,
+    ProfileEntry,
+    ProfileResponse,
+    AllocationEntry,
+    TracemallocResponse,
+    StructureSize,
+    MemoryReport,
+)
 from .inventory import InventarioActivoBase, InventarioActivoCreate, InventarioActivoUpdate, InventarioActivoOut, InventarioActivoOwner
 
 __all__ = [
     # Auth schemas
     "UserBase",
     "UserCreate", 
+    "UserBulkCreate",
+    "UserBulkResult",
+    "UserBulkResponse",
     "UserUpdate",
     "UserResponse",
     "UserLogin",
     "Token",
     "TokenData",
+    "TokenIntrospectionRequest",
+    "TokenIntrospection",
+    "TokenIntrospectionResponse",
+    "ApiKeyCreate",
+    "ApiKeyResponse",
+    "ApiKeyCreated",
+    # Admin schemas
+    "ProfileRequest",
+    "ProfileEntry",
+    "ProfileResponse",
+    "AllocationEntry",
+    "TracemallocResponse",
+    "StructureSize",
+    "MemoryReport",
     # Inventory schemas
     "InventarioActivoBase",
     "InventarioActivoCreate",
@@ -0,0 +1,79 @@
+from datetime import datetime
+from typing import Any, Dict, List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+# Upper bound for functions listed in one profile
+MAX_PROFILE_TOP = 200
+
+
+class ProfileRequest(BaseModel):
+    """Request to replay under the profiler"""
+    method: Literal["GET", "POST", "PUT", "PATCH", "DELETE"] = "GET"
+    path: str = Field(..., pattern=r"^/", description="Path to replay, e.g. /inventario/")
+    params: Dict[str, str] = Field(default_factory=dict)
+    json_body: Optional[Any] = None
+    # The caller's Authorization header is forwarded unless overridden here
+    headers: Dict[str, str] = Field(default_factory=dict)
+    top: int = Field(30, ge=1, le=MAX_PROFILE_TOP)
+    sort: Literal["cumulative", "tottime", "ncalls"] = "cumulative"
+    format: Literal["json", "pstats"] = "json"
+
+
+class ProfileEntry(BaseModel):
+    """One function in a profile"""
+    function: str
+    file: str
+    line: int
+    ncalls: int
+    tottime_ms: float
+    cumtime_ms: float
+
+
+class ProfileResponse(BaseModel):
+    """Top functions of a profiled request"""
+    method: str
+    path: str
+    status_code: int
+    elapsed_ms: float
+    total_calls: int
+    sort: str
+    top: List[ProfileEntry]
+
+
+class AllocationEntry(BaseModel):
+    """Memory allocated from one file (or line) according to tracemalloc"""
+    location: str
+    size_kb: float
+    count: int
+    # Change since the baseline snapshot (diff mode only)
+    size_diff_kb: Optional[float] = None
+    count_diff: Optional[int] = None
+
+
+class TracemallocResponse(BaseModel):
+    """tracemalloc state and the top allocation sites"""
+    tracing: bool
+    frames: int
+    traced_current_kb: float
+    traced_peak_kb: float
+    group_by: str
+    diff: bool
+    baseline_taken_at: Optional[datetime] = None
+    top: List[AllocationEntry] = []
+
+
+class StructureSize(BaseModel):
+    """Approximate retained size of an in-process structure"""
+    name: str
+    entries: int
+    size_bytes: int
+
+
+class MemoryReport(BaseModel):
+    """Process memory and the gateway's in-process structures"""
+    pid: int
+    rss_bytes: Optional[int]
+    peak_rss_bytes: Optional[int]
+    tracing: bool
+    structures: List[StructureSize]
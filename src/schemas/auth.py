@@ -1,7 +1,16 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Literal, Optional
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
+
+# Upper bound for one bulk registration request (keeps the INSERT under the bind-parameter limit)
+MAX_BULK_USERS = 1000
+
+# Upper bound for tokens in one introspection request
+MAX_INTROSPECTION_TOKENS = 100
+
+# Logins containing "@" are looked up by email, so such a username could never log in
+USERNAME_PATTERN = r"^[^@]+$"
 
 
 class UserBase(BaseModel):
@@ -16,22 +25,50 @@ class UserBase(BaseModel):
 
 class UserCreate(UserBase):
     """Schema for creating a new user"""
+    username: str = Field(..., min_length=1, pattern=USERNAME_PATTERN)
     password: str
 
 
+class UserBulkItem(UserCreate):
+    """User in a bulk registration (admin only, so it may grant the introspection role)"""
+    can_introspect: bool = False
+
+
+class UserBulkCreate(BaseModel):
+    """Schema for registering many users in one request"""
+    users: List[UserBulkItem] = Field(..., min_length=1, max_length=MAX_BULK_USERS)
+
+
+class UserBulkResult(BaseModel):
+    """Per-user outcome of a bulk registration"""
+    username: str
+    email: EmailStr
+    status: Literal["created", "exists"]
+    id: Optional[int] = None
+
+
+class UserBulkResponse(BaseModel):
+    """Schema for bulk registration response"""
+    created: int
+    existing: int
+    results: List[UserBulkResult]
+
+
 class UserUpdate(BaseModel):
     """Schema for updating user information"""
     email: Optional[EmailStr] = None
-    username: Optional[str] = None
+    username: Optional[str] = Field(None, min_length=1, pattern=USERNAME_PATTERN)
     full_name: Optional[str] = None
     dueno_de_activo: Optional[str] = None
     is_active: Optional[bool] = None
     is_superuser: Optional[bool] = None
+    can_introspect: Optional[bool] = None
 
 
 class UserResponse(UserBase):
     """Schema for user response (without password)"""
     id: int
+    can_introspect: bool = False
     created_at: datetime
     updated_at: datetime
 
@@ -55,4 +92,53 @@ class Token(BaseModel):
 class TokenData(BaseModel):
     """Token data schema for JWT payload"""
     user_id: Optional[int] = None
-    username: Optional[str] = None
\ No newline at end of file
+    username: Optional[str] = None
+
+
+class TokenIntrospectionRequest(BaseModel):
+    """Schema for batch token introspection"""
+    tokens: List[str] = Field(..., min_length=1, max_length=MAX_INTROSPECTION_TOKENS)
+    token_type_hint: Literal["access_token", "refresh_token"] = "access_token"
+
+
+class TokenIntrospection(BaseModel):
+    """RFC 7662 style introspection result (inactive tokens only carry active=false)"""
+    active: bool
+    sub: Optional[str] = None
+    username: Optional[str] = None
+    token_type: Optional[str] = None
+    exp: Optional[int] = None
+    jti: Optional[str] = None
+    is_superuser: Optional[bool] = None
+    dueno_de_activo: Optional[str] = None
+
+
+class TokenIntrospectionResponse(BaseModel):
+    """Introspection results in the same order as the request"""
+    results: List[TokenIntrospection]
+
+
+class ApiKeyCreate(BaseModel):
+    """Schema for creating an API key for a service principal"""
+    name: str
+    user_id: int
+    expires_in_days: Optional[int] = Field(None, ge=1)
+
+
+class ApiKeyResponse(BaseModel):
+    """Schema for API key response (never includes the key itself)"""
+    id: int
+    name: str
+    key_prefix: str
+    user_id: int
+    is_active: bool
+    expires_at: Optional[datetime] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class ApiKeyCreated(ApiKeyResponse):
+    """Schema returned once at creation, including the plaintext key"""
+    key: str
@@ -1,37 +1,87 @@
 #!/usr/bin/env python3
 """
 Script de inicio para Railway deployment
+
+Modos (SERVER_MODE):
+- production (por defecto): varios workers (WEB_CONCURRENCY o núcleos disponibles),
+  uvloop + httptools, backlog/keep-alive/apagado ordenado configurables.
+- development: un worker con el loop y parser por defecto de uvicorn.
 """
 import os
 import sys
 import uvicorn
 
+from src.config.cpus import available_cpus
+
+
+def has_module(name: str) -> bool:
+    try:
+        __import__(name)
+        return True
+    except ImportError:
+        return False
+
+
+def server_options(mode: str) -> dict:
+    """uvicorn.run keyword arguments for the given mode"""
+    if mode == "development":
+        return {"workers": 1, "access_log": True}
+
+    workers = int(os.getenv("WEB_CONCURRENCY", "0")) or available_cpus()
+    options = {
+        "workers": workers,
+        # uvloop is not available on Windows; fall back to asyncio there
+        "loop": "uvloop" if has_module("uvloop") else "asyncio",
+        "http": "httptools" if has_module("httptools") else "h11",
+        "backlog": int(os.getenv("UVICORN_BACKLOG", "2048")),
+        # Keep above the load balancer's idle timeout to avoid races on reused connections
+        "timeout_keep_alive": int(os.getenv("UVICORN_KEEPALIVE", "75")),
+        # Seconds in-flight requests get to finish after SIGTERM before connections are closed
+        "timeout_graceful_shutdown": int(os.getenv("UVICORN_GRACEFUL_TIMEOUT", "30")),
+        "access_log": os.getenv("UVICORN_ACCESS_LOG", "true").lower() == "true",
+    }
+    limit_concurrency = os.getenv("UVICORN_LIMIT_CONCURRENCY")
+    if limit_concurrency:
+        options["limit_concurrency"] = int(limit_concurrency)
+    return options
+
+
 def main():
     # Get port from environment variable (Railway sets this)
     port = int(os.getenv("PORT", 8000))
-    
+    mode = os.getenv("SERVER_MODE", "production").lower()
+    options = server_options(mode)
+
+    # Workers inherit this, so per-process pools (bcrypt threads) size themselves by it
+    os.environ["WEB_CONCURRENCY"] = str(options["workers"])
+
     # Print startup information
     print("=" * 50)
     print("🚀 API Auth Gateway - Starting...")
     print(f"📡 Port: {port}")
     print(f"🏠 Host: 0.0.0.0")
+    print(f"⚙️  Mode: {mode} | Workers: {options['workers']} | "
+          f"Loop: {options.get('loop', 'auto')} | HTTP: {options.get('http', 'auto')}")
     print(f"🔍 Health check: http://0.0.0.0:{port}/health")
     print(f"📚 API Docs: http://0.0.0.0:{port}/docs")
     print("=" * 50)
-    
+
     # Check if DATABASE_URL is set
     database_url = os.getenv("DATABASE_URL")
     if database_url:
         print(f"✅ Database configured: {database_url[:50]}...")
+        # Every worker has its own pool
+        per_worker = int(os.getenv("DB_POOL_SIZE", "5")) + int(os.getenv("DB_MAX_OVERFLOW", "10"))
+        print(f"🔌 Max DB connections: {options['workers']} workers x {per_worker} = {options['workers'] * per_worker}")
     else:
         print("⚠️  DATABASE_URL not configured - using mock database for healthcheck only")
-    
+
     # Check critical environment variables
     jwt_secret = os.getenv("JWT_SECRET_KEY")
     if not jwt_secret:
         print("⚠️  JWT_SECRET_KEY not configured - generating temporary key")
         os.environ["JWT_SECRET_KEY"] = "temp-development-key-not-for-production"
-    
+
     try:
         # Start the server
         print("🔥 Starting uvicorn server...")
@@ -39,10 +89,9 @@ def main():
             "main:app",
             host="0.0.0.0",
             port=port,
-            workers=1,
             reload=False,
-            access_log=True,
-            log_level="info"
+            log_level="info",
+            **options,
         )
     except Exception as e:
         print(f"❌ Error starting server: {e}")
@@ -53,4 +102,4 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()